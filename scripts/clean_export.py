@@ -12,6 +12,7 @@ import json
 import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -24,16 +25,23 @@ def text_from_html(html: str) -> str:
     return s.strip()
 
 
-def extract_label_value(html: str, label: str) -> str | None:
+@lru_cache(maxsize=None)
+def _label_patterns(label: str) -> tuple[re.Pattern, ...]:
     # Look for patterns like '<strong>Label :</strong> VALUE' or 'Label : VALUE'
     # Try several variants
-    patterns = [
-        rf"{re.escape(label)}\s*[:\u00A0\s]*</?strong>\s*([^<\n]+)",
-        rf"<strong>\s*{re.escape(label)}\s*[:\u00A0\s]*<\\/strong>\s*([^<\n]+)",
-        rf"{re.escape(label)}\s*[:\u00A0\s]*([^<\n]+)",
-    ]
-    for p in patterns:
-        m = re.search(p, html, flags=re.I)
+    return tuple(
+        re.compile(p, flags=re.I)
+        for p in (
+            rf"{re.escape(label)}\s*[:\u00A0\s]*</?strong>\s*([^<\n]+)",
+            rf"<strong>\s*{re.escape(label)}\s*[:\u00A0\s]*<\\/strong>\s*([^<\n]+)",
+            rf"{re.escape(label)}\s*[:\u00A0\s]*([^<\n]+)",
+        )
+    )
+
+
+def extract_label_value(html: str, label: str) -> str | None:
+    for p in _label_patterns(label):
+        m = p.search(html)
         if m:
             val = m.group(1)
             val = re.sub(r"&nbsp;", " ", val)
@@ -158,17 +166,16 @@ def main(json_path: str):
             )
 
             # parse docket entries
-            entries = extract_docket_entries(html)
-            for e in entries:
-                ewriter.writerow(
-                    [
-                        case_id,
-                        e["doc_id"] or "",
-                        e["entry_date"] or "",
-                        e["entry_office"] or "",
-                        e["summary"] or "",
-                    ]
+            ewriter.writerows(
+                (
+                    case_id,
+                    e["doc_id"] or "",
+                    e["entry_date"] or "",
+                    e["entry_office"] or "",
+                    e["summary"] or "",
                 )
+                for e in extract_docket_entries(html)
+            )
 
     print(f"Wrote cleaned case CSV: {cases_csv}")
     print(f"Wrote docket entries CSV: {entries_csv}")
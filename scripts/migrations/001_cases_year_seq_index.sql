@@ -0,0 +1,17 @@
+-- Index for per-year lookups on court file numbers (IMM-<seq>-YY).
+-- Serves "latest case of a year" (UrlDiscoveryService.get_last_processed_case)
+-- and the per-year filters in get_processing_stats /
+-- ExportService.get_cases_by_year_from_database without a full scan:
+--   WHERE right(court_file_no, 3) = '-25'
+--   ORDER BY substring(court_file_no from '^IMM-(\d+)-\d{2}$')::bigint DESC NULLS LAST
+-- Apply with: psql -h <host> -U <user> -d <db> -f scripts/migrations/001_cases_year_seq_index.sql
+
+-- The sequence is cast to bigint: with an int cast any sequence above
+-- 2^31-1 would make INSERTs fail with "integer out of range". Earlier
+-- revisions created an int-cast index as cases_year_seq_idx; drop it.
+DROP INDEX IF EXISTS cases_year_seq_idx;
+
+CREATE INDEX IF NOT EXISTS cases_year_seq_bigint_idx ON cases (
+  right(court_file_no, 3),
+  (substring(court_file_no from '^IMM-(\d+)-\d{2}$')::bigint) DESC NULLS LAST
+);
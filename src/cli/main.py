@@ -1,12 +1,18 @@
 """Command-line interface for Federal Court Case Scraper."""
 
 import argparse
+import hashlib
+import json
+import random
 import sys
+import threading
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional
 
 from src.lib.config import Config
+from src.lib.db_pool import close_all as close_all_db_connections
 from src.lib.logging_config import get_logger, setup_logging
 from src.models.case import Case
 from src.services.case_scraper_service import CaseScraperService
@@ -17,6 +23,22 @@ from src.cli.purge import purge_year
 
 logger = get_logger()
 
+# UTC timestamp prefix of batch run ids, e.g. 20250101_120000
+RUN_ID_TIME_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def _make_run_id(parameters: dict) -> str:
+    """Build a run id from the UTC start time and a digest of the run parameters.
+
+    The digest is stable across processes (unlike ``hash()``) and independent
+    of key order, so runs with the same parameters share a suffix.
+    """
+    payload = json.dumps(parameters, sort_keys=True, default=str).encode("utf-8")
+    digest = hashlib.blake2b(payload, digest_size=4).hexdigest()
+    epoch = time.time_ns() // 1_000_000_000
+    ts = datetime.fromtimestamp(epoch, timezone.utc).strftime(RUN_ID_TIME_FORMAT)
+    return f"{ts}_{digest}"
+
 
 class FederalCourtScraperCLI:
     """Command-line interface for the Federal Court Case Scraper."""
@@ -35,7 +57,10 @@ class FederalCourtScraperCLI:
         self._scraper_headless = False
         self.discovery = UrlDiscoveryService(self.config)
         self.exporter = ExportService(self.config)
-        self.emergency_stop = False
+        # Event + lock so the stop flag and failure counter stay consistent
+        # when cases are scraped from multiple threads.
+        self._emergency_stop = threading.Event()
+        self._failures_lock = threading.Lock()
         self.consecutive_failures = 0
         self.max_consecutive_failures = 10  # Emergency stop threshold
         # Force flag determines whether existing DB records should be re-scraped
@@ -58,7 +83,10 @@ class FederalCourtScraperCLI:
         logger.info(f"Starting scrape of case: {case_number}")
 
         try:
-            # Lazily create scraper if not initialized
+            # Lazily create scraper if not initialized. The WebDriver is not
+            # closed after each case to enable session reuse across batch
+            # operations; individual modal/page cleanup is performed inside
+            # CaseScraperService methods.
             if self.scraper is None:
                 self.scraper = CaseScraperService(headless=self._scraper_headless)
 
@@ -69,14 +97,25 @@ class FederalCourtScraperCLI:
                 else:
                     logger.info("Reusing initialized page; skipping initialize_page()")
             except Exception as e:
-                logger.error(f"Failed to initialize page for scraping: {e}")
-                raise
+                # A throttling page has no search form, so initialization
+                # fails on it. Fall through to the backoff loop instead of
+                # counting it toward the emergency stop; search_case
+                # re-initializes on each retry.
+                if self.scraper._check_rate_limited(self.scraper._driver, case_number) is not True:
+                    logger.error(f"Failed to initialize page for scraping: {e}")
+                    raise
+                logger.warning(f"Rate limited loading the search page for {case_number}; backing off")
 
             # Search for the case
-            found = self.scraper.search_case(case_number)
+            found = self._search_with_backoff(case_number)
             if not found:
+                if getattr(self.scraper, "rate_limited", False) is True:
+                    # Throttling is not evidence of a broken run; do not let
+                    # it push the emergency-stop counter.
+                    logger.warning(f"Case {case_number} skipped: still rate limited after retries")
+                    return None
                 logger.warning(f"Case {case_number} not found")
-                self.consecutive_failures += 1
+                self._record_failure()
                 return None
 
             # Scrape the case data with retries that re-run the search page
@@ -98,7 +137,7 @@ class FederalCourtScraperCLI:
 
                 if case:
                     logger.info(f"Successfully scraped case: {case.case_id} (attempt {attempt})")
-                    self.consecutive_failures = 0
+                    self._reset_failures()
                     break
                 logger.warning(f"Scrape attempt {attempt} failed for case: {case_number}")
                 if attempt < max_scrape_attempts:
@@ -152,24 +191,73 @@ class FederalCourtScraperCLI:
                 return case
             else:
                 logger.warning(f"Failed to scrape case after {max_scrape_attempts} attempts: {case_number}")
-                self.consecutive_failures += 1
+                self._record_failure()
                 return None
 
         except Exception as e:
             logger.error(f"Error scraping case {case_number}: {e}")
-            self.consecutive_failures += 1
+            self._record_failure()
             return None
-        finally:
-            # Do not close the full WebDriver here to enable session reuse
-            # across batch operations. Individual modal/page cleanup is
-            # performed inside CaseScraperService methods.
 
-            # Check for emergency stop
+    @property
+    def emergency_stop(self) -> bool:
+        """Whether the emergency stop has been triggered."""
+        return self._emergency_stop.is_set()
+
+    @emergency_stop.setter
+    def emergency_stop(self, value: bool) -> None:
+        if value:
+            self._emergency_stop.set()
+        else:
+            self._emergency_stop.clear()
+
+    def _record_failure(self) -> None:
+        """Count a failed case and trigger the emergency stop at the threshold."""
+        with self._failures_lock:
+            self.consecutive_failures += 1
             if self.consecutive_failures >= self.max_consecutive_failures:
-                logger.error(
-                    f"Emergency stop triggered after {self.consecutive_failures} consecutive failures"
-                )
-                self.emergency_stop = True
+                if not self._emergency_stop.is_set():
+                    logger.error(
+                        f"Emergency stop triggered after {self.consecutive_failures} consecutive failures"
+                    )
+                self._emergency_stop.set()
+
+    def _reset_failures(self) -> None:
+        """Reset the consecutive failure counter after a successful case."""
+        with self._failures_lock:
+            self.consecutive_failures = 0
+
+    def _search_with_backoff(self, case_number: str) -> bool:
+        """Search for a case, backing off while the site reports HTTP 429.
+
+        Retries use exponential backoff with jitter, bounded by
+        ``Config.get_rate_limit_backoff_cap_seconds()``.
+
+        Args:
+            case_number: Case number to search
+
+        Returns:
+            bool: True if the case was found
+        """
+        max_retries = Config.get_rate_limit_max_retries()
+        cap = Config.get_rate_limit_backoff_cap_seconds()
+        scraper = self.scraper
+        if scraper is None:
+            return False
+        for attempt in range(max_retries + 1):
+            found = bool(scraper.search_case(case_number))
+            if found or getattr(scraper, "rate_limited", False) is not True:
+                return found
+            if attempt == max_retries:
+                break
+            delay = Config.get_rate_limit_seconds() * (2 ** attempt)
+            delay = min(cap, delay + random.uniform(0, 0.25 * delay))
+            logger.warning(
+                f"Rate limited searching {case_number}; retrying in {delay:.1f}s "
+                f"({attempt + 1}/{max_retries})"
+            )
+            time.sleep(delay)
+        return False
 
     def shutdown(self) -> None:
         """Shutdown resources (close scraper)"""
@@ -178,6 +266,10 @@ class FederalCourtScraperCLI:
                 self.scraper.close()
         except Exception:
             pass
+        try:
+            close_all_db_connections()
+        except Exception:
+            pass
     def scrape_batch_cases(
         self, year: int, max_cases: Optional[int] = None
     ) -> tuple[list, list]:
@@ -201,7 +293,9 @@ class FederalCourtScraperCLI:
         # Run-level logger to record per-case outcomes (configurable)
         run_logger = RunLogger() if Config.get_enable_run_logger() else None
         if run_logger:
-            run_logger.start()
+            run_logger.start(
+                run_id=_make_run_id({"year": year, "max_cases": max_cases, "force": self.force})
+            )
 
         # Get case numbers to process
         case_numbers = self.discovery.generate_case_numbers_from_last(year, max_cases)
@@ -209,6 +303,20 @@ class FederalCourtScraperCLI:
 
         print(f"Processing {total_to_process} case numbers for year {year}...")
 
+        # Look up which cases are already stored with one query for the
+        # whole batch. When the exporter has no bulk lookup, or it fails
+        # (cases_exist returns None or raises), the loop below checks each
+        # case individually.
+        existing: Optional[set] = None
+        bulk_exists = getattr(self.exporter, "cases_exist", None)
+        if not self.force and bulk_exists is not None:
+            try:
+                existing = bulk_exists(case_numbers)
+            except Exception:
+                existing = None
+            if existing is None:
+                logger.debug("Bulk existence check failed; checking cases individually")
+
         try:
             for i, case_number in enumerate(case_numbers, 1):
                 if self.emergency_stop:
@@ -219,7 +327,11 @@ class FederalCourtScraperCLI:
 
                 # If not forcing, skip if case already exists in DB (avoid duplicate scraping)
                 try:
-                    if not self.force and self.exporter.case_exists(case_number):
+                    if not self.force and (
+                        case_number in existing
+                        if existing is not None
+                        else self.exporter.case_exists(case_number)
+                    ):
                         print(f"→ Skipping {case_number}: already in database")
                         skipped.append({"case_number": case_number, "status": "skipped"})
                         if run_logger:
@@ -235,11 +347,6 @@ class FederalCourtScraperCLI:
                             print(
                                 f"Progress: {processed}/{total_to_process} processed, {len(cases)} successful ({success_rate:.1f}%)"
                             )
-                        # Check if we should skip this year
-                        if self.discovery.should_skip_year(year, consecutive_failures):
-                            logger.info(
-                                f"Skipping remaining cases for year {year} due to consecutive failures"
-                            )
                         # Stop if we reached the limit
                         if max_cases and len(cases) >= max_cases:
                             break
@@ -505,9 +612,6 @@ Examples:
 
                     # Write audit file to output/ (configurable)
                     if Config.get_write_audit():
-                        import json
-                        from pathlib import Path
-
                         out_dir = Path("output")
                         out_dir.mkdir(parents=True, exist_ok=True)
                         audit_path = out_dir / f"audit_{timestamp}.json"
@@ -11,13 +11,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import psycopg2
+
 from src.lib.config import Config
 from src.services.files_purge import backup_output_year
 from src.services.files_purge import purge_output_year, remove_modal_html_for_year
-from src.services.purge_service import db_purge_year
+from src.services.purge_service import db_purge_year, year_from_court_file_no
 import os
 from typing import Dict
 
+# Rows fetched per round trip by the dry-run server-side cursor.
+DRY_RUN_ITERSIZE = 2000
+
 
 def _find_output_files_for_year(output_dir: Path, year: int, per_case_subdir: Optional[str] = None) -> List[Path]:
     """Find files under `output/<year>` and `output/<per_case_subdir>/<year>`.
@@ -123,9 +128,6 @@ def purge_year(
         # so operators can preview exactly which rows would be deleted.
         if dry_run:
             try:
-                import psycopg2
-                import re
-
                 cfg = Config.get_db_config()
 
                 def get_conn_read():
@@ -152,23 +154,21 @@ def purge_year(
                     if not id_col or not court_col:
                         raise RuntimeError(f"Cannot determine id/case identifier columns (found: {cols})")
 
-                    cur.execute(f"SELECT {id_col}, {court_col} FROM cases")
-                    rows = cur.fetchall()
+                    # Stream the scan through a server-side cursor so memory
+                    # stays flat on large tables. As in db_purge_year, the
+                    # suffix LIKEs let the DB return only this year's rows and
+                    # year_from_court_file_no still validates each one.
                     candidate_ids = []
-                    for r in rows:
-                        cid = r[0]
-                        cf = r[1] if len(r) > 1 else None
-                        if not cf:
-                            continue
-                        s = str(cf)
-                        m4 = re.search(r"-(\d{4})$", s)
-                        if m4 and int(m4.group(1)) == year:
-                            candidate_ids.append(cid)
-                            continue
-                        m2 = re.search(r"-(\d{2})$", s)
-                        if m2 and (2000 + int(m2.group(1))) == year:
-                            candidate_ids.append(cid)
-                            continue
+                    with conn.cursor(name="purge_dry_run_scan") as scan:
+                        scan.itersize = DRY_RUN_ITERSIZE
+                        scan.execute(
+                            f"SELECT {id_col}, {court_col} FROM cases"
+                            f" WHERE {court_col} LIKE '%-{year:04d}'"
+                            f" OR {court_col} LIKE '%-{year % 100:02d}'"
+                        )
+                        for cid, cf in scan:
+                            if cf and year_from_court_file_no(cf) == year:
+                                candidate_ids.append(cid)
 
                     summary["db"]["candidate_case_ids"] = candidate_ids
                     summary["db"]["cases_selected_count"] = len(candidate_ids)
@@ -202,16 +202,8 @@ def purge_year(
     if not dry_run and not files_only:
         try:
             # Build a get_connection factory using configured DB settings
-            try:
-                import psycopg2
-
-                def get_conn():
-                    cfg = Config.get_db_config()
-                    return psycopg2.connect(**cfg)
-            except Exception:
-                # If psycopg2 is not available or connection fails, raise
-                def get_conn():
-                    raise RuntimeError("No DB driver (psycopg2) available or DB not configured")
+            def get_conn():
+                return psycopg2.connect(**Config.get_db_config())
 
             db_result = db_purge_year(year, get_conn, transactional=True, sql_year_filter=sql_year_filter)
             summary["db"] = db_result
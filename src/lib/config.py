@@ -32,7 +32,10 @@ DEFAULT_BROWSER = "chrome"
 DEFAULT_PER_CASE_SUBDIR = "json"
 DEFAULT_EXPORT_WRITE_RETRIES = 2
 DEFAULT_EXPORT_WRITE_BACKOFF_SECONDS = 1
+DEFAULT_EXPORT_FSYNC = False
 DEFAULT_MAX_DRIVER_RESTARTS = 1
+DEFAULT_RATE_LIMIT_MAX_RETRIES = 3
+DEFAULT_RATE_LIMIT_BACKOFF_CAP_SECONDS = 60
 
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_LOG_FILE = "logs/scraper.log"
@@ -42,6 +45,9 @@ DEFAULT_DB_PORT = 5432
 DEFAULT_DB_NAME = "fct_db"
 DEFAULT_DB_USER = "fct_user"
 DEFAULT_DB_PASSWORD = "fctpass"
+DEFAULT_DB_POOL_MIN_SIZE = 1
+DEFAULT_DB_POOL_MAX_SIZE = 8
+DEFAULT_DB_BATCH_ASYNC_COMMIT = False
 
 DEFAULT_SAVE_MODAL_HTML = False
 DEFAULT_ENABLE_RUN_LOGGER = True
@@ -150,6 +156,15 @@ class Config:
             or DEFAULT_EXPORT_WRITE_BACKOFF_SECONDS
         )
 
+    @classmethod
+    def get_export_fsync(cls) -> bool:
+        val = _get_from_config("app", "export_fsync")
+        if val is None:
+            val = os.getenv("FCT_EXPORT_FSYNC")
+        if isinstance(val, str):
+            return val.lower() == "true"
+        return bool(val) if val is not None else DEFAULT_EXPORT_FSYNC
+
     @classmethod
     def get_max_driver_restarts(cls) -> int:
         return int(
@@ -158,6 +173,22 @@ class Config:
             or DEFAULT_MAX_DRIVER_RESTARTS
         )
 
+    @classmethod
+    def get_rate_limit_max_retries(cls) -> int:
+        return int(
+            _get_from_config("app", "rate_limit_max_retries")
+            or os.getenv("FCT_RATE_LIMIT_MAX_RETRIES")
+            or DEFAULT_RATE_LIMIT_MAX_RETRIES
+        )
+
+    @classmethod
+    def get_rate_limit_backoff_cap_seconds(cls) -> float:
+        return float(
+            _get_from_config("app", "rate_limit_backoff_cap_seconds")
+            or os.getenv("FCT_RATE_LIMIT_BACKOFF_CAP_SECONDS")
+            or DEFAULT_RATE_LIMIT_BACKOFF_CAP_SECONDS
+        )
+
     @classmethod
     def get_docket_parse_max_errors(cls) -> int:
         return int(
@@ -204,6 +235,22 @@ class Config:
             or DEFAULT_BROWSER
         )
 
+    @classmethod
+    def get_chrome_debugger_address(cls) -> Optional[str]:
+        return (
+            _get_from_config("app", "chrome_debugger_address")
+            or os.getenv("FCT_CHROME_DEBUGGER_ADDRESS")
+            or None
+        )
+
+    @classmethod
+    def get_selenium_remote_url(cls) -> Optional[str]:
+        return (
+            _get_from_config("app", "selenium_remote_url")
+            or os.getenv("FCT_SELENIUM_REMOTE_URL")
+            or None
+        )
+
     @classmethod
     def get_log_level(cls) -> str:
         return (
@@ -297,6 +344,31 @@ class Config:
             or DEFAULT_DB_PASSWORD
         )
 
+    @classmethod
+    def get_db_pool_min_size(cls) -> int:
+        return int(
+            _get_from_config("database", "pool_min_size")
+            or os.getenv("DB_POOL_MIN_SIZE")
+            or DEFAULT_DB_POOL_MIN_SIZE
+        )
+
+    @classmethod
+    def get_db_pool_max_size(cls) -> int:
+        return int(
+            _get_from_config("database", "pool_max_size")
+            or os.getenv("DB_POOL_MAX_SIZE")
+            or DEFAULT_DB_POOL_MAX_SIZE
+        )
+
+    @classmethod
+    def get_db_batch_async_commit(cls) -> bool:
+        val = _get_from_config("database", "batch_async_commit")
+        if val is None:
+            val = os.getenv("DB_BATCH_ASYNC_COMMIT")
+        if isinstance(val, str):
+            return val.lower() == "true"
+        return bool(val) if val is not None else DEFAULT_DB_BATCH_ASYNC_COMMIT
+
     @classmethod
     def get_db_config(cls) -> dict:
         return {
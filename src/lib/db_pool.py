@@ -0,0 +1,84 @@
+"""Shared PostgreSQL connection pool.
+
+Services borrow connections from a process-wide ``ThreadedConnectionPool``
+instead of opening a new connection (TCP handshake + authentication) for
+every query. Pools are keyed by connection parameters so callers using
+different databases (e.g. tests) do not share connections.
+"""
+
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from psycopg2.pool import ThreadedConnectionPool
+
+from src.lib.config import Config
+
+_pools: dict[tuple, ThreadedConnectionPool] = {}
+_lock = threading.Lock()
+
+
+def get_pool(db_config: Optional[dict] = None) -> ThreadedConnectionPool:
+    """Return the pool for ``db_config``, creating it on first use.
+
+    Args:
+        db_config: psycopg2 connection keyword arguments; defaults to
+            ``Config.get_db_config()``.
+
+    Returns:
+        ThreadedConnectionPool: Pool shared by all callers with the same config
+    """
+    cfg = dict(db_config or Config.get_db_config())
+    key = tuple(sorted(cfg.items()))
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = ThreadedConnectionPool(
+                Config.get_db_pool_min_size(), Config.get_db_pool_max_size(), **cfg
+            )
+            _pools[key] = pool
+        return pool
+
+
+@contextmanager
+def get_connection(db_config: Optional[dict] = None) -> Iterator:
+    """Borrow a pooled connection for the duration of a ``with`` block.
+
+    Any transaction left open (including read-only ones) is rolled back
+    before the connection goes back to the pool; callers that write must
+    ``commit()`` inside the block. Broken connections are discarded.
+
+    Args:
+        db_config: psycopg2 connection keyword arguments; defaults to
+            ``Config.get_db_config()``.
+
+    Yields:
+        A psycopg2 connection
+    """
+    pool = get_pool(db_config)
+    conn = pool.getconn()
+    discard = False
+    try:
+        yield conn
+    finally:
+        if conn.closed:
+            discard = True
+        else:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+        pool.putconn(conn, close=discard)
+
+
+def close_all() -> None:
+    """Close every pooled connection (also run at interpreter exit)."""
+    with _lock:
+        for pool in _pools.values():
+            if not pool.closed:
+                pool.closeall()
+        _pools.clear()
+
+
+atexit.register(close_all)
@@ -1,9 +1,11 @@
 """Case scraping service for Federal Court cases using search form."""
 
+import re
 import time
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
@@ -11,6 +13,7 @@ from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
@@ -25,44 +28,189 @@ from src.models.docket_entry import DocketEntry
 
 logger = get_logger()
 
+# Case id as rendered in the modal title, e.g. "IMM-1234-25"
+_CASE_ID_IN_TEXT_RE = re.compile(r"(IMM[-–—]\S+\-?\d{2,})")
+# Date-like substrings inside free text: DD-MMM-YYYY, DD/MM/YYYY, YYYY-MM-DD
+_DATE_SUBSTRING_PATTERNS = (
+    re.compile(r"\b\d{1,2}[-/]\w{3,9}[-/]\d{4}\b"),
+    re.compile(r"\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b"),
+    re.compile(r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b"),
+)
+
+# URL validation is pure with respect to the URL, so retries and re-submitted
+# URLs in a batch reuse the earlier result.
+_validate_case_url = lru_cache(maxsize=4096)(URLValidator.validate_case_url)
+_extract_case_number_from_url = lru_cache(maxsize=4096)(
+    URLValidator.extract_case_number_from_url
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_docket_date(s: str) -> Optional[date]:
+    """Parse a docket-table date cell, trying the formats the site renders.
+
+    Docket tables repeat the same few dates many times, and each failed
+    ``strptime`` attempt raises, so results are memoized per string.
+    """
+    if not s:
+        return None
+    s = s.strip()
+    try:
+        return date.fromisoformat(s)
+    except Exception:
+        pass
+    # common formats
+    fmts = [
+        "%Y-%m-%d",
+        "%d-%m-%Y",
+        "%d/%m/%Y",
+        "%B %d, %Y",
+        "%d %B %Y",
+        "%Y/%m/%d",
+    ]
+    for f in fmts:
+        try:
+            return datetime.strptime(s, f).date()
+        except Exception:
+            continue
+    # Try some additional common formats
+    extra = [
+        "%b %d, %Y",
+        "%d %b %Y",
+        "%d %B, %Y",
+    ]
+    for f in extra:
+        try:
+            return datetime.strptime(s, f).date()
+        except Exception:
+            continue
+
+    # Extract common date-like substrings inside the text (e.g., '10-NOV-2025', '06-JUN-2025', '10/11/2025')
+    try:
+        for pat in _DATE_SUBSTRING_PATTERNS:
+            m = pat.search(s)
+            if m:
+                ds = m.group(0)
+                # Try several parse formats for the extracted substring
+                try_fmts = [
+                    "%d-%b-%Y",
+                    "%d-%B-%Y",
+                    "%d/%m/%Y",
+                    "%Y-%m-%d",
+                    "%d-%m-%Y",
+                    "%Y/%m/%d",
+                    "%d %b %Y",
+                ]
+                for tf in try_fmts:
+                    try:
+                        return datetime.strptime(ds, tf).date()
+                    except Exception:
+                        continue
+                # as last resort try dateutil on substring
+                try:
+                    from dateutil.parser import parse as _parse
+
+                    d: datetime = _parse(ds, fuzzy=True)
+                    return d.date()
+                except Exception:
+                    pass
+    except Exception:
+        pass
+
+    # Fallback: try dateutil on the whole string if available
+    try:
+        from dateutil.parser import parse as _parse
+
+        d = _parse(s, fuzzy=True)
+        return d.date()
+    except Exception:
+        return None
+
 
 class CaseScraperService:
     """Service for scraping Federal Court cases using search form."""
 
     BASE_URL = "https://www.fct-cf.ca/en/court-files-and-decisions/court-files"
 
-    def __init__(self, headless: bool = True):
+    # Chrome arguments applied to every driver (headless is added separately)
+    CHROME_ARGUMENTS: ClassVar[tuple[str, ...]] = (
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--window-size=1920,1080",
+        "--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+    )
+
+    # Resources blocked at the DevTools layer so Chrome never opens
+    # connections for them. Stylesheets are kept because modal visibility
+    # (and therefore clickability checks) depends on them.
+    BLOCKED_URL_PATTERNS = (
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.svg",
+        "*.woff",
+        "*.woff2",
+        "*google-analytics*",
+        "*googletagmanager*",
+        "*doubleclick*",
+        "*facebook*",
+    )
+
+    def __init__(
+        self,
+        headless: bool = True,
+        extra_args: Optional[list[str]] = None,
+        debugger_address: Optional[str] = None,
+        remote_url: Optional[str] = None,
+    ):
         """Initialize the case scraper service.
 
         Args:
             headless: Whether to run browser in headless mode
+            extra_args: Additional Chrome arguments (e.g. ``--proxy-server=...``)
+            debugger_address: ``host:port`` of a Chrome started with
+                ``--remote-debugging-port``; when set, drivers attach to that
+                browser instead of launching a new one. Defaults to
+                ``Config.get_chrome_debugger_address()``.
+            remote_url: Selenium Grid / standalone-chrome endpoint (e.g.
+                ``http://localhost:4444/wd/hub``); when set, sessions are
+                created with ``webdriver.Remote`` instead of a local
+                ChromeDriver. Defaults to ``Config.get_selenium_remote_url()``.
         """
         self.headless = headless
+        self.extra_args = list(extra_args or [])
+        self.debugger_address = debugger_address or Config.get_chrome_debugger_address()
+        self.remote_url = remote_url or Config.get_selenium_remote_url()
         self.rate_limiter = EthicalRateLimiter()  # 3-6s random delay
-        self._driver: Optional[webdriver.Chrome] = None
+        self._driver: Optional[WebDriver] = None
         self._initialized = False
         # Restart tracking
         self._restart_count = 0
         self._max_restarts = Config.get_max_driver_restarts()
         # search_mode: 'court_number' uses the courtNumber input; 'generic' uses the site-wide search input
         self._search_mode: str = "court_number"
+        # Set by search_case when the site answered with a throttling page
+        # (HTTP 429) so callers can back off instead of counting a failure.
+        self.rate_limited = False
 
-    def _setup_driver(self) -> webdriver.Chrome:
+    def _setup_driver(self) -> WebDriver:
         """Setup Chrome WebDriver with appropriate options.
 
         Returns:
-            webdriver.Chrome: Configured Chrome driver
+            WebDriver: Configured Chrome or remote driver
         """
         options = Options()
-        if self.headless:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            "--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
-        )
+        if self.debugger_address:
+            # Attach to the long-running browser; launch arguments belong to
+            # that process and are ignored here.
+            options.add_experimental_option("debuggerAddress", self.debugger_address)
+        else:
+            if self.headless:
+                options.add_argument("--headless")
+            for arg in (*self.CHROME_ARGUMENTS, *self.extra_args):
+                options.add_argument(arg)
         # Reduce blocking time on driver.get by returning after DOMContentLoaded
         try:
             options.page_load_strategy = "eager"
@@ -70,17 +218,35 @@ class CaseScraperService:
             # Older selenium versions may not support attribute assignment
             options.set_capability("pageLoadStrategy", "eager")
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        if self.remote_url:
+            driver = webdriver.Remote(command_executor=self.remote_url, options=options)
+        else:
+            service = Service(ChromeDriverManager().install())
+            driver = webdriver.Chrome(service=service, options=options)
 
-        logger.info("Chrome WebDriver initialized")
+        # Block images, fonts and trackers once per driver; best-effort since
+        # CDP commands are Chrome-specific.
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(self.BLOCKED_URL_PATTERNS)}
+            )
+        except Exception:
+            logger.debug("Failed to set blocked URLs via CDP", exc_info=True)
+
+        if self.remote_url:
+            logger.info(f"Remote WebDriver session created on {self.remote_url}")
+        elif self.debugger_address:
+            logger.info(f"Chrome WebDriver attached to {self.debugger_address}")
+        else:
+            logger.info("Chrome WebDriver initialized")
         return driver
 
-    def _get_driver(self) -> webdriver.Chrome:
+    def _get_driver(self) -> WebDriver:
         """Get or create WebDriver instance.
 
         Returns:
-            webdriver.Chrome: WebDriver instance
+            WebDriver: WebDriver instance
         """
         if self._driver is None:
             self._driver = self._setup_driver()
@@ -341,7 +507,47 @@ class CaseScraperService:
                 logger.error(f"Fallback initialize failed: {fallback_exc}")
                 raise
 
-    def _restart_driver(self) -> webdriver.Chrome:
+    def _is_rate_limited(self, driver: WebDriver) -> bool:
+        """Return True when the current page is an HTTP 429 throttling response.
+
+        Selenium does not expose response status codes, so detection relies on
+        the error page title that the server and common proxies render.
+        """
+        try:
+            title = (driver.title or "").lower()
+        except Exception:
+            return False
+        # Word-bounded so case numbers like "IMM-14290-25" don't match.
+        return bool(re.search(r"\b429\b", title)) or "too many requests" in title
+
+    def _check_rate_limited(self, driver: Optional[WebDriver], case_number: str) -> bool:
+        """Record and report a 429 page; used before every failed search return.
+
+        A throttled page usually has no search form at all, so this must run
+        on the early-exit paths too, not only after polling for results.
+        """
+        if driver is None or not self._is_rate_limited(driver):
+            return False
+        logger.warning(f"Rate limited (HTTP 429) while searching case: {case_number}")
+        self.rate_limited = True
+        return True
+
+    def _page_html(self, driver: WebDriver) -> str:
+        """Return the current document HTML.
+
+        Reads ``document.documentElement.outerHTML`` through a single script
+        call, falling back to ``driver.page_source`` when the script result is
+        unavailable.
+        """
+        try:
+            html = driver.execute_script("return document.documentElement.outerHTML")
+            if isinstance(html, str):
+                return html
+        except Exception:
+            logger.debug("outerHTML via execute_script failed; using page_source", exc_info=True)
+        return str(driver.page_source)
+
+    def _restart_driver(self) -> WebDriver:
         """Attempt to restart the WebDriver up to configured limit.
 
         Returns a fresh WebDriver instance or raises if the max restarts
@@ -386,8 +592,15 @@ class CaseScraperService:
         Returns:
             bool: True if case found, False if no results
         """
+        self.rate_limited = False
         if not self._initialized:
-            self.initialize_page()
+            try:
+                self.initialize_page()
+            except Exception:
+                # A 429 page has no search form, so initialization fails on it
+                if self._check_rate_limited(self._driver, case_number):
+                    return False
+                raise
 
         driver = self._get_driver()
 
@@ -396,6 +609,10 @@ class CaseScraperService:
             # that re-initializes the page. This mirrors the harness retry
             # strategy for flaky client-side population.
             for attempt in range(2):
+                # The (re)initialized page may itself be a throttling response
+                if self._check_rate_limited(driver, case_number):
+                    return False
+
                 # Apply rate limiting
                 self.rate_limiter.wait_if_needed()
 
@@ -437,6 +654,8 @@ class CaseScraperService:
                     pass
 
                 if case_input is None:
+                    if self._check_rate_limited(driver, case_number):
+                        return False
                     logger.debug(f"Could not locate a search input for attempt {attempt + 1}")
                     # If this was the first attempt, re-initialize and retry
                     if attempt == 0:
@@ -445,7 +664,8 @@ class CaseScraperService:
                             driver = self._get_driver()
                             continue
                         except Exception:
-                            pass
+                            if self._check_rate_limited(driver, case_number):
+                                return False
                     return False
 
                 # Use robust send keys with JS fallback
@@ -500,6 +720,11 @@ class CaseScraperService:
                     logger.info(f"Results found for case: {case_number}")
                     return True
 
+                # A throttling page is not a missing case; report it so the
+                # caller can back off and retry.
+                if self._check_rate_limited(driver, case_number):
+                    return False
+
                 # As a final fallback, check for any table rows present
                 if driver.find_elements(By.XPATH, "//table//tbody//tr"):
                     logger.info(f"Table rows present but specific case not detected: {case_number}")
@@ -536,10 +761,14 @@ class CaseScraperService:
                 except Exception:
                     logger.debug("Failed to save search diagnostics", exc_info=True)
 
+                if self._check_rate_limited(driver, case_number):
+                    return False
                 logger.warning(f"No results table found for case: {case_number}")
                 return False
 
         except Exception as e:
+            if self._check_rate_limited(driver, case_number):
+                return False
             logger.error(f"Error searching case {case_number}: {e}")
             return False
 
@@ -1243,10 +1472,8 @@ class CaseScraperService:
 
             if title_el:
                 # Extract IMM-... pattern from title text
-                import re
-
                 txt = title_el.text or ""
-                m = re.search(r"(IMM[-–—]\S+\-?\d{2,})", txt)
+                m = _CASE_ID_IN_TEXT_RE.search(txt)
                 if m:
                     data["case_id"] = m.group(1)
         except Exception:
@@ -1288,8 +1515,6 @@ class CaseScraperService:
 
         # Strategy 5: some modals render case id, style of cause, and nature on the same paragraph/line
         try:
-            import re
-
             paras = modal_element.find_elements(By.TAG_NAME, "p")
             # prefer paragraphs containing the case id or the phrase 'court file'
             candidate_para = None
@@ -1395,8 +1620,6 @@ class CaseScraperService:
 
         # Post-process combined fields: some modals include office and language in one
         try:
-            import re
-
             # Normalize excessive whitespace
             for k in ("office", "language"):
                 if data.get(k) and isinstance(data[k], str):
@@ -1477,89 +1700,6 @@ class CaseScraperService:
         """
         entries = []
 
-        def try_parse_date(s: str):
-            if not s:
-                return None
-            s = s.strip()
-            try:
-                return date.fromisoformat(s)
-            except Exception:
-                pass
-            # common formats
-            fmts = [
-                "%Y-%m-%d",
-                "%d-%m-%Y",
-                "%d/%m/%Y",
-                "%B %d, %Y",
-                "%d %B %Y",
-                "%Y/%m/%d",
-            ]
-            for f in fmts:
-                try:
-                    return datetime.strptime(s, f).date()
-                except Exception:
-                    continue
-            # Try some additional common formats
-            extra = [
-                "%b %d, %Y",
-                "%d %b %Y",
-                "%d %B, %Y",
-            ]
-            for f in extra:
-                try:
-                    return datetime.strptime(s, f).date()
-                except Exception:
-                    continue
-
-            # Extract common date-like substrings inside the text (e.g., '10-NOV-2025', '06-JUN-2025', '10/11/2025')
-            try:
-                import re
-
-                # Patterns to match DD-MMM-YYYY or DD-MON-YYYY (month letters), or numeric dates
-                patterns = [
-                    r"\b\d{1,2}[-/]\w{3,9}[-/]\d{4}\b",
-                    r"\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b",
-                    r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b",
-                ]
-                for pat in patterns:
-                    m = re.search(pat, s)
-                    if m:
-                        ds = m.group(0)
-                        # Try several parse formats for the extracted substring
-                        try_fmts = [
-                            "%d-%b-%Y",
-                            "%d-%B-%Y",
-                            "%d/%m/%Y",
-                            "%Y-%m-%d",
-                            "%d-%m-%Y",
-                            "%Y/%m/%d",
-                            "%d %b %Y",
-                        ]
-                        for tf in try_fmts:
-                            try:
-                                return datetime.strptime(ds, tf).date()
-                            except Exception:
-                                continue
-                        # as last resort try dateutil on substring
-                        try:
-                            from dateutil.parser import parse as _parse
-
-                            d = _parse(ds, fuzzy=True)
-                            return d.date()
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-
-            # Fallback: try dateutil on the whole string if available
-            try:
-                from dateutil.parser import parse as _parse
-
-                d = _parse(s, fuzzy=True)
-                return d.date()
-            except Exception:
-                return None
-
         try:
             # Choose the correct table for docket entries: prefer tables with headers matching 'ID' and 'Recorded Entry Summary' or 'Date Filed'
             tables = modal_element.find_elements(By.XPATH, ".//table")
@@ -1750,7 +1890,7 @@ class CaseScraperService:
                     if date_idx_header is not None and date_idx_header < len(
                         cell_texts
                     ):
-                        entry_date = try_parse_date(cell_texts[date_idx_header])
+                        entry_date = _parse_docket_date(cell_texts[date_idx_header])
                     if office_idx_header is not None and office_idx_header < len(
                         cell_texts
                     ):
@@ -1763,7 +1903,7 @@ class CaseScraperService:
                     # If header mapping wasn't available, try to detect a date cell among columns
                     if entry_date is None:
                         for idx, txt in enumerate(cell_texts):
-                            d = try_parse_date(txt)
+                            d = _parse_docket_date(txt)
                             if d:
                                 entry_date = d
                                 date_idx = idx
@@ -1867,7 +2007,7 @@ class CaseScraperService:
         Raises:
             ValueError: If URL is invalid
         """
-        if not URLValidator.validate_case_url(url)[0]:
+        if not _validate_case_url(url)[0]:
             raise ValueError("Invalid case URL")
 
         self.rate_limiter.wait_if_needed()
@@ -1882,10 +2022,10 @@ class CaseScraperService:
 
         # Extract data from page
         title = driver.title
-        html_content = driver.page_source
+        html_content = self._page_html(driver)
 
         # Extract case number from URL
-        case_number = URLValidator.extract_case_number_from_url(url)
+        case_number = _extract_case_number_from_url(url)
         if not case_number:
             raise ValueError("Could not extract case number from URL")
 
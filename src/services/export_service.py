@@ -7,17 +7,69 @@ import time
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Any, Iterator, List, Optional, Set, Tuple
 
 from src.lib.config import Config
 
+orjson: Optional[ModuleType]
+try:
+    import orjson  # optional fast encoder
+except Exception:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
-_SANITIZE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+_SAFE_NAME_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._-"
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
+class _SanitizeTable(dict):
+    """``str.translate`` table mapping every unsafe code point to ``-``.
+
+    Entries are filled in on first sight, so the table covers non-ASCII
+    input without being pre-built for all of Unicode.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        value = codepoint if chr(codepoint) in _SAFE_NAME_CHARS else ord("-")
+        self[codepoint] = value
+        return value
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
+def _encode_json(obj: Any, indent: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON, using orjson when it is installed.
+
+    Output is compact unless ``indent`` is set (two-space indentation, as
+    ``json.dumps(indent=2)``). Non-ASCII characters are kept as-is and
+    values JSON cannot represent are converted with ``str``. For the case
+    and docket payloads written here the bytes match the stdlib encoder;
+    inputs orjson rejects (non-string keys, integers beyond 64 bits) fall
+    back to ``json.dumps``, while NaN/Infinity (``null`` under orjson) and
+    some float renderings still differ between the two.
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return bytes(orjson.dumps(obj, default=str, option=option))
+        except TypeError:
+            pass
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, default=str, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, default=str, separators=(",", ":"))
+    return text.encode("utf-8")
 
 
 def _sanitize_case_number(name: str) -> str:
-    s = _SANITIZE_RE.sub("-", name or "")
-    s = re.sub(r"-+", "-", s).strip("-_")
+    s = (name or "").translate(_SANITIZE_TABLE)
+    s = _DASH_RUN_RE.sub("-", s).strip("-_")
     return s or "case"
 
 
@@ -33,12 +85,19 @@ def _unique_with_suffix(path: Path, max_attempts: int = 100) -> Path:
     raise FileExistsError(f"No available filename after {max_attempts} attempts: {path}")
 
 
-def export_case_to_json(case: dict, output_root: Optional[str] = None) -> str:
+def export_case_to_json(
+    case: dict, output_root: Optional[str] = None, fsync: Optional[bool] = None
+) -> str:
     """Export a case dict to a per-case JSON file.
 
+    The file is fsynced before the rename only when ``fsync`` is true
+    (default: ``Config.get_export_fsync()``).
+
     Returns the final file path as a string. Raises on persistent failures.
     """
     output_root = output_root or Config.get_output_dir()
+    if fsync is None:
+        fsync = Config.get_export_fsync()
     per_case_subdir = Config.get_per_case_subdir()
     retries = Config.get_export_write_retries()
     base_backoff = Config.get_export_write_backoff_seconds()
@@ -62,10 +121,12 @@ def export_case_to_json(case: dict, output_root: Optional[str] = None) -> str:
     for attempt in range(1, retries + 1):
         try:
             fd, tmp_path = tempfile.mkstemp(dir=str(dir_path))
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(case, f, ensure_ascii=False, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
+            with os.fdopen(fd, "wb") as f:
+                # Encode up front so the payload goes out in one write
+                f.write(_encode_json(case, indent=True))
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(tmp_path, final_path)
             return str(final_path)
         except Exception as exc:  # pragma: no cover - handle filesystem errors
@@ -85,25 +146,57 @@ def export_case_to_json(case: dict, output_root: Optional[str] = None) -> str:
 
 import json
 import time
+from collections import OrderedDict
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Optional, Tuple
 import re
 
-import psycopg2
-from psycopg2.extras import execute_values
+from psycopg2.extras import RealDictCursor, execute_values
 
 from src.lib.config import Config
+from src.lib.db_pool import get_connection
 from src.lib.logging_config import get_logger
 from src.models.case import Case
 from src.models.docket_entry import DocketEntry
 
 logger = get_logger()
 
+# Two-digit case year at the end of a court file number (IMM-<seq>-YY)
+_CASE_YEAR_RE = re.compile(r"IMM-\d+-([0-9]{2})$")
+# First YYYY[-/]MM[-/]DD date inside a filing_date/scraped_at string
+_DATE_DIGITS_RE = re.compile(r"(\d{4})[-/]?(\d{2})[-/]?(\d{2})")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]")
+# Standard court file number shape: IMM-<seq>-<yy> (exactly three parts)
+_COURT_FILE_NO_FORMAT_RE = re.compile(r"IMM-[^-]*-[^-]*")
+# Case attributes stored in the `cases` UPSERT, after court_file_no
+_CASE_ROW_FIELDS = attrgetter(
+    "case_type",
+    "action_type",
+    "nature_of_proceeding",
+    "filing_date",
+    "office",
+    "style_of_cause",
+    "language",
+)
+# DocketEntry attributes stored in `docket_entries`, after court_file_no
+_ENTRY_ROW_FIELDS = attrgetter("doc_id", "entry_date", "entry_office", "summary")
+
 
 class ExportService:
     """Service for exporting case data to CSV, JSON, and database formats."""
 
+    # Rows per INSERT statement when saving cases in bulk
+    BATCH_PAGE_SIZE = 1000
+    # Existence lookups are reused for this long (seconds) and at most this
+    # many court file numbers are remembered.
+    EXISTS_CACHE_TTL_SECONDS = 30
+    EXISTS_CACHE_MAX_ENTRIES = 50_000
+    # Rows fetched per round trip when streaming cases with a server-side cursor
+    STREAM_ITERSIZE = 1000
+    # Write buffer (bytes) for streamed JSON exports
+    EXPORT_WRITE_BUFFER = 1 << 20
+
     def __init__(self, config: Config, output_dir: str = "output"):
         """
         Initialize the export service.
@@ -114,11 +207,17 @@ class ExportService:
         """
         self.config = config
         self.db_config = Config.get_db_config()
+        self.batch_async_commit = Config.get_db_batch_async_commit()
+        self.export_fsync = Config.get_export_fsync()
+        # Per-case output directories already created by this instance
+        self._known_dirs: Set[Path] = set()
         # Respect configured output dir when caller passes default placeholder
         if output_dir == "output":
             output_dir = Config.get_output_dir()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # court_file_no -> (monotonic time, exists); LRU-ordered
+        self._exists_cache: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
         logger.info(
             f"ExportService initialized with output directory: {self.output_dir}"
         )
@@ -150,12 +249,15 @@ class ExportService:
         file_path = self.output_dir / filename
 
         try:
-            # Convert cases to dictionaries
-            case_dicts = [case.to_dict() for case in cases]
-
-            # Write to JSON file
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(case_dicts, f, indent=2, ensure_ascii=False, default=str)
+            # Stream one case per line so the whole export is never held in
+            # memory as a list of dicts plus one large encoded string. A large
+            # write buffer keeps the per-case writes from becoming syscalls.
+            with open(file_path, "wb", buffering=self.EXPORT_WRITE_BUFFER) as f:
+                f.write(b"[")
+                for i, case in enumerate(cases):
+                    f.write(b",\n" if i else b"\n")
+                    f.write(_encode_json(case.to_dict()))
+                f.write(b"\n]\n")
 
             logger.info(
                 f"Successfully exported {len(cases)} cases to JSON: {file_path}"
@@ -166,6 +268,59 @@ class ExportService:
             logger.error(f"Failed to export cases to JSON: {e}")
             raise
 
+    def export_year_to_ndjson(self, year: int, filename: Optional[str] = None) -> str:
+        """
+        Export all stored cases for a year straight from PostgreSQL as NDJSON.
+
+        Rows are serialized by the server (``row_to_json``) and streamed to the
+        file with ``COPY ... TO STDOUT``, so no Case objects are built and no
+        per-row Python encoding happens.
+
+        Args:
+            year: Case year to export
+            filename: Optional filename (default: auto-generated with timestamp)
+
+        Returns:
+            Path to the exported NDJSON file (one JSON object per line)
+
+        Raises:
+            Exception: On database or filesystem errors
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"cases_{year}_{timestamp}.ndjson"
+
+        file_path = self.output_dir / filename
+
+        with get_connection(self.db_config) as conn:
+            cursor = conn.cursor()
+            query = cursor.mogrify(
+                """
+                SELECT row_to_json(c) FROM cases c
+                WHERE right(c.court_file_no, 3) = %s
+                  AND c.court_file_no LIKE 'IMM-%%'
+                ORDER BY c.court_file_no
+            """,
+                (f"-{year % 100:02d}",),
+            ).decode("utf-8")
+            # CSV format with control-character quote/delimiter writes each
+            # JSON document verbatim (text format would escape backslashes).
+            with open(file_path, "w", encoding="utf-8") as f:
+                cursor.copy_expert(
+                    f"COPY ({query}) TO STDOUT WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')",
+                    f,
+                )
+            cursor.close()
+
+        logger.info(f"Exported cases for year {year} from database to NDJSON: {file_path}")
+        return str(file_path)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create ``path`` (with parents) once per instance."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+
     def export_case_to_json(self, case: Case, date_str: Optional[str] = None) -> str:
         """
         Export a single case to a per-case JSON file under `output/json/<YYYY>/`.
@@ -185,8 +340,6 @@ class ExportService:
             raise ValueError("export_case_to_json requires a Case instance")
 
         # Determine date for filename
-        from datetime import datetime
-
         if date_str is None:
             # Derive year from the case number when possible. Case numbers are
             # formatted as IMM-<seq>-YY where YY indicates the two-digit year.
@@ -195,9 +348,7 @@ class ExportService:
             year = None
             try:
                 cf = getattr(case, "court_file_no", None) or getattr(case, "case_id", None) or ""
-                import re
-
-                m = re.search(r"IMM-\d+-([0-9]{2})$", str(cf))
+                m = _CASE_YEAR_RE.search(str(cf))
                 if m:
                     yy = int(m.group(1))
                     # assume 2000-based years (e.g. '24' -> 2024)
@@ -217,13 +368,11 @@ class ExportService:
                     date_from_case = None
 
                 if date_from_case:
-                    m2 = re.search(r"(\d{4})[-/]?(\d{2})[-/]?(\d{2})", date_from_case)
+                    m2 = _DATE_DIGITS_RE.search(date_from_case)
                     if m2:
                         date_str = f"{m2.group(1)}{m2.group(2)}{m2.group(3)}"
                         year = int(date_str[:4])
                 if year is None:
-                    from datetime import datetime
-
                     date_str = datetime.now().strftime("%Y%m%d")
                     year = int(date_str[:4])
             else:
@@ -237,51 +386,55 @@ class ExportService:
         # Use configured subdirectory name for per-case JSON (default 'json')
         per_case_subdir = Config.get_per_case_subdir()
         json_dir = self.output_dir / per_case_subdir / str(year)
-        json_dir.mkdir(parents=True, exist_ok=True)
 
         # Base filename: <case-number>-<YYYYMMDD>.json
         safe_case = getattr(case, "court_file_no", None) or getattr(case, "case_id", None) or "case"
         # sanitize filename characters
-        safe_case = re.sub(r"[^A-Za-z0-9._-]", "_", str(safe_case))
+        safe_case = _UNSAFE_FILENAME_CHARS_RE.sub("_", str(safe_case))
         base_name = f"{safe_case}-{date_str}.json"
         final_path = json_dir / base_name
         # Overwrite existing file with same case/date to avoid leaving stale/incorrect files
 
-        # Atomic write: write to a temp file in same directory then rename
-        import tempfile
+        # Build payload from case.to_dict() and include docket_entries
+        payload = case.to_dict()
+        if hasattr(case, "docket_entries") and case.docket_entries:
+            try:
+                payload["docket_entries"] = [
+                    e.to_dict() if hasattr(e, "to_dict") else e for e in case.docket_entries
+                ]
+            except Exception:
+                # Fallback: include raw objects if serialization fails
+                payload["docket_entries"] = list(case.docket_entries)
 
+        # Encode once, outside the retry loop; json.dump would issue a write
+        # per token instead of a single write of the whole document.
+        encoded = _encode_json(payload, indent=True)
+
+        # Atomic write: write to a temp file in same directory then rename
         max_retries = Config.get_export_write_retries()
         backoff = Config.get_export_write_backoff_seconds()
         attempt = 0
         while True:
             attempt += 1
             try:
+                self._ensure_dir(json_dir)
                 fd, tmp_path = tempfile.mkstemp(dir=str(json_dir), prefix="tmp_", suffix=".json")
-                with open(fd, "w", encoding="utf-8") as tf:
-                    import json as _json
-
-                    # Build payload from case.to_dict() and include docket_entries
-                    payload = case.to_dict()
-                    if hasattr(case, "docket_entries") and case.docket_entries:
-                        try:
-                            payload["docket_entries"] = [
-                                e.to_dict() if hasattr(e, "to_dict") else e for e in case.docket_entries
-                            ]
-                        except Exception:
-                            # Fallback: include raw objects if serialization fails
-                            payload["docket_entries"] = list(case.docket_entries)
-
-                    _json.dump(payload, tf, indent=2, ensure_ascii=False, default=str)
+                with open(fd, "wb") as tf:
+                    tf.write(encoded)
+                    if self.export_fsync:
+                        tf.flush()
+                        os.fsync(tf.fileno())
 
                 # Use os.replace to ensure atomic move
-                import os
-
                 os.replace(tmp_path, str(final_path))
 
                 logger.info(f"Exported case {safe_case} to JSON: {final_path}")
                 return str(final_path)
 
             except Exception as e:
+                # The directory may have been removed underneath us (purge);
+                # recreate it on the next attempt.
+                self._known_dirs.discard(json_dir)
                 logger.warning(f"Attempt {attempt}: failed to write per-case JSON for {safe_case}: {e}")
                 if attempt >= max_retries:
                     logger.error(f"Exceeded max retries ({max_retries}) writing JSON for {safe_case}")
@@ -326,8 +479,6 @@ class ExportService:
             raise ValueError("Cannot export empty case list")
 
         if base_filename is None:
-            from datetime import datetime
-
             base_filename = f"cases_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
         try:
@@ -349,23 +500,39 @@ class ExportService:
         Raises:
             ValueError: If any case is invalid
         """
+        is_standard = _COURT_FILE_NO_FORMAT_RE.fullmatch
         for i, case in enumerate(cases):
             if not isinstance(case, Case):
                 raise ValueError(f"Case at index {i} is not a Case instance")
 
             # Check required fields
-            if not case.court_file_no:
+            court_file_no = case.court_file_no
+            if not court_file_no:
                 raise ValueError(f"Case at index {i} has empty case_id")
 
             # Validate case_id format (should be IMM-XXXXX-YY)
-            if (
-                not case.court_file_no.startswith("IMM-")
-                or len(case.court_file_no.split("-")) != 3
-            ):
+            if not is_standard(court_file_no):
                 logger.warning(
-                    f"Case at index {i} has non-standard court_file_no format: {case.court_file_no}"
+                    f"Case at index {i} has non-standard court_file_no format: {court_file_no}"
                 )
 
+    def _list_exports(self) -> List[Tuple[str, float]]:
+        """
+        List export files in the output directory with their mtimes.
+
+        A single ``os.scandir`` pass; the directory entry supplies the stat
+        result, so no second stat per file is needed for sorting.
+
+        Returns:
+            List of (path, st_mtime) for top-level ``*.json`` files
+        """
+        with os.scandir(self.output_dir) as it:
+            return [
+                (entry.path, entry.stat().st_mtime)
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+
     def get_export_history(self) -> List[str]:
         """
         Get list of all exported files in the output directory.
@@ -373,8 +540,7 @@ class ExportService:
         Returns:
             List of exported file paths (JSON and CSV files)
         """
-        export_files = [str(f) for f in self.output_dir.glob("*.json")]
-        return sorted(export_files)
+        return sorted(path for path, _ in self._list_exports())
 
     def cleanup_old_exports(self, keep_recent: int = 10) -> int:
         """
@@ -386,13 +552,13 @@ class ExportService:
         Returns:
             Number of files deleted
         """
-        export_files = list(self.output_dir.glob("*.json"))
+        export_files = self._list_exports()
 
         # Sort by modification time (newest first)
-        export_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+        export_files.sort(key=itemgetter(1), reverse=True)
 
         # Keep only the most recent files
-        files_to_delete = export_files[keep_recent:]
+        files_to_delete = [Path(path) for path, _ in export_files[keep_recent:]]
 
         deleted_count = 0
         for file_path in files_to_delete:
@@ -420,23 +586,174 @@ class ExportService:
             'new', 'updated', or 'failed'. Message contains error details if failed.
         """
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
+            with get_connection(self.db_config) as conn:
+                cursor = conn.cursor()
+
+                # UPSERT case data; ``xmax = 0`` is true only for a freshly
+                # inserted row, so one round trip tells new from updated.
+                cursor.execute(
+                    """
+                    INSERT INTO cases (
+                        court_file_no, case_type, type_of_action, nature_of_proceeding,
+                        filing_date, office, style_of_cause, language, scraped_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (court_file_no) DO UPDATE SET
+                        case_type = EXCLUDED.case_type,
+                        type_of_action = EXCLUDED.type_of_action,
+                        nature_of_proceeding = EXCLUDED.nature_of_proceeding,
+                        filing_date = EXCLUDED.filing_date,
+                        office = EXCLUDED.office,
+                        style_of_cause = EXCLUDED.style_of_cause,
+                        language = EXCLUDED.language,
+                        scraped_at = EXCLUDED.scraped_at
+                    RETURNING (xmax = 0) AS inserted
+                """,
+                    self._case_row(case, datetime.now()),
+                )
+                inserted = cursor.fetchone()[0]
 
-            # Determine if this is a new case or update
-            cursor.execute(
-                "SELECT 1 FROM cases WHERE court_file_no = %s LIMIT 1",
-                (case.court_file_no,),
-            )
-            exists = cursor.fetchone() is not None
+                # Save docket entries if they exist
+                if hasattr(case, "docket_entries") and case.docket_entries:
+                    self._save_docket_entries(
+                        cursor, case.court_file_no, case.docket_entries
+                    )
+
+                conn.commit()
+                cursor.close()
+
+            self._remember_exists(case.court_file_no, True)
+            status = "new" if inserted else "updated"
+            logger.info(f"Successfully saved case {case.court_file_no} to database ({status})")
+            return status, None
+
+        except Exception as e:
+            logger.error(f"Failed to save case {case.court_file_no} to database: {e}")
+            return "failed", str(e)
+
+    def _cached_exists(self, court_file_no: str) -> Optional[bool]:
+        """Return a fresh cached existence result, or None if unknown/stale."""
+        entry = self._exists_cache.get(court_file_no)
+        if entry is None:
+            return None
+        checked_at, exists = entry
+        if time.monotonic() - checked_at >= self.EXISTS_CACHE_TTL_SECONDS:
+            return None
+        self._exists_cache.move_to_end(court_file_no)
+        return exists
+
+    def _remember_exists(self, court_file_no: str, exists: bool) -> None:
+        """Record an existence result, evicting the least recently used entry."""
+        self._exists_cache[court_file_no] = (time.monotonic(), exists)
+        self._exists_cache.move_to_end(court_file_no)
+        if len(self._exists_cache) > self.EXISTS_CACHE_MAX_ENTRIES:
+            self._exists_cache.popitem(last=False)
+
+    def case_exists(self, court_file_no: str) -> bool:
+        """Return True if a case with given `court_file_no` exists in the database.
+
+        Results are cached for `EXISTS_CACHE_TTL_SECONDS`; saves through this
+        service update the cache, so retries within a run skip the query.
+        """
+        cached = self._cached_exists(court_file_no)
+        if cached is not None:
+            return cached
+        try:
+            with get_connection(self.db_config) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT 1 FROM cases WHERE court_file_no = %s LIMIT 1", (court_file_no,)
+                )
+                exists = cursor.fetchone() is not None
+                cursor.close()
+            self._remember_exists(court_file_no, exists)
+            return exists
+        except Exception as e:
+            logger.warning(f"Failed to check existence for {court_file_no}: {e}")
+            return False
+
+    def cases_exist(self, court_file_nos: List[str]) -> Optional[Set[str]]:
+        """Return the subset of `court_file_nos` already stored in the database.
+
+        Uses a single ``= ANY(...)`` query so batch callers pay one round trip
+        instead of one per case.
+
+        Returns:
+            Set of stored court file numbers, or None when the lookup failed
+            (so callers can fall back to per-case checks instead of treating
+            every case as new).
+        """
+        found: Set[str] = set()
+        pending = []
+        for cf in court_file_nos:
+            cached = self._cached_exists(cf)
+            if cached is None:
+                pending.append(cf)
+            elif cached:
+                found.add(cf)
+        if not pending:
+            return found
+        try:
+            with get_connection(self.db_config) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT court_file_no FROM cases WHERE court_file_no = ANY(%s)",
+                    (pending,),
+                )
+                stored = {row[0] for row in cursor.fetchall()}
+                cursor.close()
+            for cf in pending:
+                self._remember_exists(cf, cf in stored)
+            return found | stored
+        except Exception as e:
+            logger.warning(f"Failed to check existence for {len(court_file_nos)} cases: {e}")
+            return None
+
+    @staticmethod
+    def _case_row(case: Case, scraped_at: datetime) -> tuple:
+        """Column values for the `cases` UPSERT, in statement order."""
+        return (case.court_file_no, *_CASE_ROW_FIELDS(case), scraped_at)
+
+    def _save_cases_batch(self, cases: List[Case]) -> dict:
+        """
+        UPSERT all cases and their docket entries in one transaction.
+
+        Rows are sent with ``execute_values`` (one statement per page of
+        ``BATCH_PAGE_SIZE`` rows) instead of one connection and transaction
+        per case.
+
+        Args:
+            cases: List of Case objects to save
 
-            # UPSERT case data
-            cursor.execute(
+        Returns:
+            dict: court_file_no -> 'new' or 'updated'
+
+        Raises:
+            Exception: On any database error; nothing is committed.
+        """
+        now = datetime.now()
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+        # statement, so keep only the last occurrence of each case.
+        latest = {case.court_file_no: case for case in cases}
+        case_rows = [self._case_row(case, now) for case in latest.values()]
+        entry_rows = [
+            (cf, *_ENTRY_ROW_FIELDS(e))
+            for cf, case in latest.items()
+            for e in (getattr(case, "docket_entries", None) or [])
+        ]
+
+        with get_connection(self.db_config) as conn:
+            cursor = conn.cursor()
+            if self.batch_async_commit:
+                # Transaction-scoped: the COMMIT below does not wait for the
+                # WAL flush; the pooled connection keeps its default.
+                cursor.execute("SET LOCAL synchronous_commit = off")
+            returned = execute_values(
+                cursor,
                 """
                 INSERT INTO cases (
                     court_file_no, case_type, type_of_action, nature_of_proceeding,
                     filing_date, office, style_of_cause, language, scraped_at
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ) VALUES %s
                 ON CONFLICT (court_file_no) DO UPDATE SET
                     case_type = EXCLUDED.case_type,
                     type_of_action = EXCLUDED.type_of_action,
@@ -446,70 +763,61 @@ class ExportService:
                     style_of_cause = EXCLUDED.style_of_cause,
                     language = EXCLUDED.language,
                     scraped_at = EXCLUDED.scraped_at
+                RETURNING court_file_no, (xmax = 0) AS inserted
             """,
-                (
-                    case.court_file_no,
-                    getattr(case, "case_type", None),
-                    getattr(case, "action_type", None),
-                    getattr(case, "nature_of_proceeding", None),
-                    getattr(case, "filing_date", None),
-                    getattr(case, "office", None),
-                    getattr(case, "style_of_cause", None),
-                    getattr(case, "language", None),
-                    datetime.now(),
-                ),
+                case_rows,
+                page_size=self.BATCH_PAGE_SIZE,
+                fetch=True,
             )
-
-            # Save docket entries if they exist
-            if hasattr(case, "docket_entries") and case.docket_entries:
-                self._save_docket_entries(
-                    cursor, case.court_file_no, case.docket_entries
+            if entry_rows:
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO docket_entries (court_file_no, id_from_table, date_filed, office, recorded_entry_summary)
+                    VALUES %s
+                    ON CONFLICT (court_file_no, id_from_table) DO NOTHING
+                """,
+                    entry_rows,
+                    page_size=self.BATCH_PAGE_SIZE,
                 )
-
             conn.commit()
             cursor.close()
-            conn.close()
-
-            status = "updated" if exists else "new"
-            logger.info(f"Successfully saved case {case.court_file_no} to database ({status})")
-            return status, None
 
-        except Exception as e:
-            logger.error(f"Failed to save case {case.court_file_no} to database: {e}")
-            return "failed", str(e)
-
-    def case_exists(self, court_file_no: str) -> bool:
-        """Return True if a case with given `court_file_no` exists in the database."""
-        try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT 1 FROM cases WHERE court_file_no = %s LIMIT 1", (court_file_no,)
-            )
-            exists = cursor.fetchone() is not None
-            cursor.close()
-            conn.close()
-            return exists
-        except Exception as e:
-            logger.warning(f"Failed to check existence for {court_file_no}: {e}")
-            return False
+        statuses = {}
+        for cf, inserted in returned:
+            self._remember_exists(cf, True)
+            statuses[cf] = "new" if inserted else "updated"
+        return statuses
 
     def save_cases_to_database(self, cases: List[Case]) -> Tuple[int, int, List[dict]]:
         """
         Save multiple cases to the database using batch UPSERT.
 
+        All cases are written in a single transaction; if that fails, each
+        case is retried on its own so one bad row does not fail the batch.
+
         Args:
             cases: List of Case objects to save
 
         Returns:
-            Tuple[int, int]: (successful_saves, failed_saves)
+            Tuple[int, int, List[dict]]: (successful_saves, failed_saves, per_case)
         """
         successful = 0
         failed = 0
         per_case = []
 
+        statuses = None
+        if cases:
+            try:
+                statuses = self._save_cases_batch(cases)
+            except Exception as e:
+                logger.warning(f"Batch save of {len(cases)} cases failed ({e}); saving individually")
+
         for case in cases:
-            status, message = self.save_case_to_database(case)
+            if statuses is not None:
+                status, message = statuses.get(case.court_file_no, "updated"), None
+            else:
+                status, message = self.save_case_to_database(case)
             per_case.append({"case_number": case.court_file_no, "status": status, "message": message})
             if status == "failed":
                 failed += 1
@@ -534,17 +842,7 @@ class ExportService:
             return
 
         # Prepare data for batch insert
-        entries_data = []
-        for entry in docket_entries:
-            entries_data.append(
-                (
-                    case_id,
-                    entry.doc_id,
-                    entry.entry_date,
-                    entry.entry_office,
-                    entry.summary,
-                )
-            )
+        entries_data = [(case_id, *_ENTRY_ROW_FIELDS(e)) for e in docket_entries]
 
         # Batch insert with ON CONFLICT DO NOTHING (since docket entries are immutable)
         execute_values(
@@ -592,22 +890,37 @@ class ExportService:
             results["error"] = str(e)
             return results
 
-    def get_case_count_from_database(self) -> int:
+    def get_case_count_from_database(self, exact: bool = True) -> int:
         """
         Get total number of cases in the database.
 
+        ``COUNT(*)`` scans the whole table. With ``exact=False`` the planner's
+        row estimate (``pg_class.reltuples``, refreshed by ANALYZE/autovacuum)
+        is returned instead in constant time. A non-positive estimate means
+        the table has never been analyzed (PostgreSQL 13 and older report 0,
+        newer versions -1), so the exact count is used.
+
+        Args:
+            exact: Return the exact count (default) rather than the estimate
+
         Returns:
             int: Number of cases
         """
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM cases")
-            count = cursor.fetchone()[0]
-
-            cursor.close()
-            conn.close()
+            with get_connection(self.db_config) as conn:
+                cursor = conn.cursor()
+                count = None
+                if not exact:
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class WHERE oid = 'cases'::regclass"
+                    )
+                    row = cursor.fetchone()
+                    if row and row[0] is not None and row[0] > 0:
+                        count = row[0]
+                if count is None:
+                    cursor.execute("SELECT COUNT(*) FROM cases")
+                    count = cursor.fetchone()[0]
+                cursor.close()
 
             return count
 
@@ -615,6 +928,39 @@ class ExportService:
             logger.error(f"Failed to get case count from database: {e}")
             return 0
 
+    def iter_cases_by_year_from_database(self, year: int) -> Iterator[dict]:
+        """
+        Stream cases for a specific year from the database.
+
+        Uses a server-side (named) cursor so rows, including stored HTML, are
+        fetched ``STREAM_ITERSIZE`` at a time instead of all at once.
+
+        Args:
+            year: Year to query
+
+        Yields:
+            dict: One case row as a column -> value mapping
+
+        Raises:
+            Exception: On database errors
+        """
+        with get_connection(self.db_config) as conn:
+            with conn.cursor(
+                name=f"cases_by_year_{year}", cursor_factory=RealDictCursor
+            ) as cursor:
+                cursor.itersize = self.STREAM_ITERSIZE
+                # Year-suffix expression is indexed by cases_year_seq_bigint_idx
+                cursor.execute(
+                    """
+                    SELECT * FROM cases
+                    WHERE right(court_file_no, 3) = %s
+                      AND court_file_no LIKE 'IMM-%%'
+                    ORDER BY court_file_no
+                """,
+                    (f"-{year % 100:02d}",),
+                )
+                yield from cursor
+
     def get_cases_by_year_from_database(self, year: int) -> List[dict]:
         """
         Get all cases for a specific year from the database.
@@ -626,24 +972,7 @@ class ExportService:
             List[dict]: List of case dictionaries
         """
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT * FROM cases
-                WHERE court_file_no LIKE %s
-                ORDER BY court_file_no
-            """,
-                (f"IMM-%-{year % 100:02d}",),
-            )
-
-            columns = [desc[0] for desc in cursor.description]
-            cases = [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-            cursor.close()
-            conn.close()
-
+            cases = list(self.iter_cases_by_year_from_database(year))
             logger.info(f"Retrieved {len(cases)} cases for year {year}")
             return cases
 
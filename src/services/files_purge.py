@@ -2,6 +2,7 @@
 
 Currently provides `backup_output_year` which archives `output/<YEAR>` into a
 tar.gz archive stored in the backups directory or at a user-specified path.
+Compression uses `pigz` (parallel gzip) when it is on PATH.
 """
 from __future__ import annotations
 
@@ -11,6 +12,8 @@ from pathlib import Path
 from typing import Optional
 import shutil
 import os
+import stat
+import subprocess
 from typing import Dict
 
 
@@ -30,11 +33,22 @@ def purge_output_year(output_dir: Path, year: int) -> Dict[str, int]:
 
     removed_files = 0
     removed_dirs = 0
-    # Now remove recursively
-    for root, dirs, files in os.walk(temp_name):
-        removed_files += len(files)
-        removed_dirs += len(dirs)
-    shutil.rmtree(temp_name)
+    # Now remove recursively, counting in the same bottom-up pass; dir_fd
+    # keeps each unlink/rmdir relative to an already-open directory.
+    for root, dirs, files, root_fd in os.fwalk(temp_name, topdown=False):
+        for name in files:
+            os.unlink(name, dir_fd=root_fd)
+            removed_files += 1
+        for name in dirs:
+            # fwalk lists a symlink to a directory in `dirs` without
+            # descending into it; remove the link, never its target.
+            st = os.stat(name, dir_fd=root_fd, follow_symlinks=False)
+            if stat.S_ISLNK(st.st_mode):
+                os.unlink(name, dir_fd=root_fd)
+            else:
+                os.rmdir(name, dir_fd=root_fd)
+            removed_dirs += 1
+    os.rmdir(temp_name)
 
     return {"removed_files": removed_files, "removed_dirs": removed_dirs}
 
@@ -49,13 +63,21 @@ def remove_modal_html_for_year(logs_dir: Path, year: int) -> Dict[str, int]:
     if not logs_dir.exists():
         return {"removed": 0, "skipped": 0}
     year_token = str(year)
-    for p in logs_dir.iterdir():
-        if p.is_file() and year_token in p.name and p.suffix.lower() in (".html", ".htm"):
-            try:
-                p.unlink()
-                removed += 1
-            except Exception:
-                skipped += 1
+    # scandir entries carry the file type from the directory read, so
+    # non-matching names cost no stat call.
+    with os.scandir(logs_dir) as it:
+        for entry in it:
+            name = entry.name
+            if (
+                year_token in name
+                and name.lower().endswith((".html", ".htm"))
+                and entry.is_file()
+            ):
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except Exception:
+                    skipped += 1
     return {"removed": removed, "skipped": skipped}
 
 
@@ -83,9 +105,27 @@ def backup_output_year(output_dir: Path, year: int, dest_dir: Optional[Path] = N
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     archive_name = dest_dir / f"output_backup_{year}_{ts}.tar.gz"
 
-    with tarfile.open(archive_name, "w:gz") as tar:
-        # add the year_dir contents; use arcname so the tar contains the
-        # year directory at its root
-        tar.add(year_dir, arcname=str(year_dir.name))
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with tarfile.open(archive_name, "w:gz") as tar:
+            # add the year_dir contents; use arcname so the tar contains the
+            # year directory at its root
+            tar.add(year_dir, arcname=str(year_dir.name))
+        return archive_name
+
+    # Compress on all cores: stream an uncompressed tar into pigz, which
+    # writes a standard gzip file.
+    with open(archive_name, "wb") as out:
+        proc = subprocess.Popen([pigz, "-c"], stdin=subprocess.PIPE, stdout=out)
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                tar.add(year_dir, arcname=str(year_dir.name))
+        finally:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            returncode = proc.wait()
+    if returncode != 0:
+        archive_name.unlink(missing_ok=True)
+        raise RuntimeError(f"pigz exited with status {returncode} while backing up {year_dir}")
 
     return archive_name
@@ -7,8 +7,28 @@ DB-agnostic by performing minimal SQL and doing filtering in Python where needed
 """
 from __future__ import annotations
 
+import re
 from datetime import datetime
-from typing import Callable, Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
+
+_YEAR4_SUFFIX_RE = re.compile(r"-(\d{4})$")
+_YEAR2_SUFFIX_RE = re.compile(r"-(\d{2})$")
+
+
+def year_from_court_file_no(value: Any) -> int | None:
+    """Return the case year encoded at the end of a court file number.
+
+    Accepts both ``IMM-123-2025`` and ``IMM-123-25`` (two-digit years are
+    taken as 20YY). Returns None when no year suffix is present.
+    """
+    s = str(value or "")
+    m4 = _YEAR4_SUFFIX_RE.search(s)
+    if m4:
+        return int(m4.group(1))
+    m2 = _YEAR2_SUFFIX_RE.search(s)
+    if m2:
+        return 2000 + int(m2.group(1))
+    return None
 
 
 def _parse_year_from_value(v: Any) -> int | None:
@@ -26,6 +46,33 @@ def _parse_year_from_value(v: Any) -> int | None:
         return None
 
 
+def _row_matches_year(
+    year: int,
+    filing_val: Any,
+    court_val: Any,
+    scraped_val: Any,
+    *,
+    has_filing: bool,
+    has_court: bool,
+) -> bool:
+    """Decide whether a `cases` row belongs to `year` (pure; no I/O).
+
+    Precedence: the filing date, then the year encoded in the court file
+    number, and only when the table has no filing column and the court file
+    number carries no year, the scraped timestamp.
+    """
+    if has_filing and _parse_year_from_value(filing_val) == year:
+        return True
+    if has_court:
+        cf_year = year_from_court_file_no(court_val)
+        if cf_year is not None:
+            # An explicit case-year decides membership on its own.
+            return cf_year == year
+    if has_filing:
+        return False
+    return _parse_year_from_value(scraped_val) == year
+
+
 def db_purge_year(
     year: int,
     get_connection: Callable[[], Any],
@@ -49,6 +96,7 @@ def db_purge_year(
         # Attempt an SQL-year-filter first when requested or auto-detect.
         # Some DBs (Postgres) support EXTRACT(YEAR FROM <ts>); SQLite does not.
         case_ids: List[int] = []
+        id_col: Optional[str] = None
         used_sql_filter = False
         try_sql = True if sql_year_filter is None or sql_year_filter is True else False
 
@@ -58,25 +106,21 @@ def db_purge_year(
                 # derive the year from the identifier in Python. We do this to
                 # avoid relying on scraped/filing timestamps and ensure the
                 # purge decision is based solely on the case id as requested.
-                # Try common column names for the court-file identifier.
-                cur.execute("SELECT id, court_file_no FROM cases")
+                # The suffix LIKEs let the DB return only this year's rows;
+                # year_from_court_file_no below still validates each one.
+                # Patterns are built from the int year, so they are inlined
+                # rather than bound (paramstyle differs between drivers).
+                cur.execute(
+                    "SELECT id, court_file_no FROM cases"
+                    f" WHERE court_file_no LIKE '%-{year:04d}'"
+                    f" OR court_file_no LIKE '%-{year % 100:02d}'"
+                )
                 rows = cur.fetchall()
                 case_ids = []
-                for r in rows:
-                    cid = r[0]
-                    cf = r[1] if len(r) > 1 else None
-                    if cf:
-                        s = str(cf)
-                        import re
-
-                        m4 = re.search(r"-(\d{4})$", s)
-                        if m4 and int(m4.group(1)) == year:
-                            case_ids.append(cid)
-                            continue
-                        m2 = re.search(r"-(\d{2})$", s)
-                        if m2 and (2000 + int(m2.group(1))) == year:
-                            case_ids.append(cid)
-                            continue
+                for cid, cf in rows:
+                    if cf and year_from_court_file_no(cf) == year:
+                        case_ids.append(cid)
+                id_col = "id"
                 used_sql_filter = True
             except Exception:
                 try:
@@ -133,72 +177,21 @@ def db_purge_year(
             desc = [d[0] for d in cur.description] if cur.description else []
             name_to_idx = {n: i for i, n in enumerate(desc)}
 
+            filing_idx = name_to_idx.get(filing_col) if filing_col else None
+            court_idx = name_to_idx.get(court_col) if court_col else None
+            scraped_idx = name_to_idx.get(scraped_col)
+
             for r in rows:
                 cid = r[name_to_idx[id_col]] if id_col in name_to_idx else r[0]
-
-                # 1) Prefer filing_date if present
-                included = False
-                if filing_col and filing_col in name_to_idx:
-                    try:
-                        filing_val = r[name_to_idx[filing_col]]
-                        fy = _parse_year_from_value(filing_val)
-                        if fy == year:
-                            case_ids.append(cid)
-                            included = True
-                    except Exception:
-                        pass
-                if included:
-                    continue
-
-                # 2) Prefer derive from court file number / case identifier
-                parse_found = False
-                if court_col and court_col in name_to_idx:
-                    try:
-                        cf = r[name_to_idx[court_col]]
-                        s = str(cf or "")
-                        import re
-
-                        m = re.search(r"-(\d{4})$", s)
-                        if m:
-                            parse_found = True
-                            y4 = int(m.group(1))
-                            if y4 == year:
-                                case_ids.append(cid)
-                                continue
-                            else:
-                                # Case identifier explicitly indicates a different
-                                # case-year; do not include based on scraped_at.
-                                continue
-                        m2 = re.search(r"-(\d{2})$", s)
-                        if m2:
-                            parse_found = True
-                            yy = int(m2.group(1))
-                            derived = 2000 + yy
-                            if derived == year:
-                                case_ids.append(cid)
-                                continue
-                            else:
-                                # Explicit two-digit year found but differs -> skip
-                                continue
-                    except Exception:
-                        pass
-
-                # 3) Last resort: use scraped_at only when we have no filing
-                # date and no parseable court-file year. If a court identifier
-                # exists but did not include a year (parse_found == False), we
-                # may safely use scraped_at as fallback (tests rely on this).
-                if scraped_col and scraped_col in name_to_idx and not included:
-                    # Only allow scraped_at when filing_col absent and either
-                    # no court identifier exists or it was not parseable.
-                    if (not filing_col) and (not court_col or not parse_found):
-                        try:
-                            scraped_at = r[name_to_idx[scraped_col]]
-                            y = _parse_year_from_value(scraped_at)
-                            if y == year:
-                                case_ids.append(cid)
-                                continue
-                        except Exception:
-                            pass
+                if _row_matches_year(
+                    year,
+                    r[filing_idx] if filing_idx is not None else None,
+                    r[court_idx] if court_idx is not None else None,
+                    r[scraped_idx] if scraped_idx is not None else None,
+                    has_filing=filing_col is not None,
+                    has_court=court_col is not None,
+                ):
+                    case_ids.append(cid)
 
         result = {
             "year": year,
@@ -1,16 +1,26 @@
 """Case number generation service for Federal Court case scraping."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, TypedDict
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
 
 from src.lib.config import Config
+from src.lib.db_pool import get_connection
 from src.lib.logging_config import get_logger
 
 logger = get_logger()
 
 
+class ProcessingStats(TypedDict, total=False):
+    """Per-year processing statistics returned by `get_processing_stats`."""
+
+    year: int
+    total_cases: int
+    last_scraped: Optional[datetime]
+    error: str
+
+
 class UrlDiscoveryService:
     """Service for generating case numbers and managing scraping progress."""
 
@@ -33,24 +43,28 @@ class UrlDiscoveryService:
             Optional[str]: Last processed case number, or None if none found
         """
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-            # Query for the highest case number in the given year
-            cursor.execute(
-                """
-                SELECT court_file_no
-                FROM cases
-                WHERE court_file_no LIKE %s
-                ORDER BY court_file_no DESC
-                LIMIT 1
-            """,
-                (f"IMM-%-{year % 100:02d}",),
-            )
+            with get_connection(self.db_config) as conn:
+                cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+                # Query for the highest case number in the given year. The
+                # year-suffix and numeric sequence expressions match
+                # cases_year_seq_bigint_idx (scripts/migrations), so this is a single
+                # index probe; ordering numerically also keeps IMM-1000-25
+                # ahead of IMM-999-25.
+                cursor.execute(
+                    r"""
+                    SELECT court_file_no
+                    FROM cases
+                    WHERE right(court_file_no, 3) = %s
+                      AND court_file_no LIKE 'IMM-%%'
+                    ORDER BY substring(court_file_no from '^IMM-(\d+)-\d{2}$')::bigint DESC NULLS LAST
+                    LIMIT 1
+                """,
+                    (f"-{year % 100:02d}",),
+                )
 
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+                result = cursor.fetchone()
+                cursor.close()
 
             if result:
                 return result["court_file_no"]
@@ -166,33 +180,34 @@ class UrlDiscoveryService:
         # This could be used to maintain a separate progress table if needed
         logger.debug(f"Case {case_id} marked as processed")
 
-    def get_processing_stats(self, year: int) -> dict:
+    def get_processing_stats(self, year: int) -> ProcessingStats:
         """Get processing statistics for a year.
 
         Args:
             year: Year to get stats for
 
         Returns:
-            dict: Statistics about processed cases
+            ProcessingStats: Statistics about processed cases
         """
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-            # Count cases for this year
-            cursor.execute(
-                """
-                SELECT COUNT(*) as total_cases,
-                       MAX(scraped_at) as last_scraped
-                FROM cases
-                WHERE court_file_no LIKE %s
-            """,
-                (f"IMM-%-{year % 100:02d}",),
-            )
+            with get_connection(self.db_config) as conn:
+                cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+                # Count cases for this year (year-suffix expression is
+                # indexed by cases_year_seq_bigint_idx)
+                cursor.execute(
+                    """
+                    SELECT COUNT(*) as total_cases,
+                           MAX(scraped_at) as last_scraped
+                    FROM cases
+                    WHERE right(court_file_no, 3) = %s
+                      AND court_file_no LIKE 'IMM-%%'
+                """,
+                    (f"-{year % 100:02d}",),
+                )
 
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+                result = cursor.fetchone()
+                cursor.close()
 
             return {
                 "year": year,
@@ -0,0 +1,163 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.services.export_service as export_module
+from src.models.case import Case
+from src.services.export_service import ExportService
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    cursor = MagicMock()
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def fake_get_connection(cfg):
+        yield conn
+
+    monkeypatch.setattr(export_module, "get_connection", fake_get_connection)
+    return conn, cursor
+
+
+@pytest.mark.parametrize("inserted,expected", [(True, "new"), (False, "updated")])
+def test_save_case_status_from_upsert_returning(fake_db, tmp_path, inserted, expected):
+    conn, cursor = fake_db
+    cursor.fetchone.return_value = (inserted,)
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+
+    status, message = svc.save_case_to_database(Case(case_id="IMM-1-25"))
+
+    assert (status, message) == (expected, None)
+    # A single UPSERT, no separate existence probe
+    assert cursor.execute.call_count == 1
+    assert "RETURNING (xmax = 0)" in cursor.execute.call_args.args[0]
+    conn.commit.assert_called_once()
+
+
+def test_save_cases_batches_in_one_transaction(fake_db, tmp_path, monkeypatch):
+    conn, cursor = fake_db
+    calls = []
+
+    def fake_execute_values(cur, sql, rows, page_size=100, fetch=False):
+        calls.append(rows)
+        if fetch:
+            return [(rows[0][0], True), (rows[1][0], False)]
+
+    monkeypatch.setattr(export_module, "execute_values", fake_execute_values)
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+
+    ok, failed, per_case = svc.save_cases_to_database(
+        [Case(case_id="IMM-1-25"), Case(case_id="IMM-2-25")]
+    )
+
+    assert (ok, failed) == (2, 0)
+    assert [p["status"] for p in per_case] == ["new", "updated"]
+    assert len(calls) == 1  # no docket entries -> only the cases statement
+    conn.commit.assert_called_once()
+
+
+def test_save_cases_falls_back_to_per_case_on_batch_error(fake_db, tmp_path, monkeypatch):
+    def failing_execute_values(*args, **kwargs):
+        raise RuntimeError("batch failed")
+
+    monkeypatch.setattr(export_module, "execute_values", failing_execute_values)
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    monkeypatch.setattr(svc, "save_case_to_database", lambda case: ("new", None))
+
+    ok, failed, per_case = svc.save_cases_to_database([Case(case_id="IMM-1-25")])
+
+    assert (ok, failed) == (1, 0)
+    assert per_case == [{"case_number": "IMM-1-25", "status": "new", "message": None}]
+
+
+def test_case_exists_cached_and_updated_by_save(fake_db, tmp_path):
+    conn, cursor = fake_db
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+
+    cursor.fetchone.return_value = None
+    assert svc.case_exists("IMM-1-25") is False
+    assert svc.case_exists("IMM-1-25") is False
+    assert cursor.execute.call_count == 1
+
+    cursor.fetchone.return_value = (True,)
+    svc.save_case_to_database(Case(case_id="IMM-1-25"))
+    calls = cursor.execute.call_count
+    assert svc.case_exists("IMM-1-25") is True
+    assert cursor.execute.call_count == calls
+    assert svc.cases_exist(["IMM-1-25"]) == {"IMM-1-25"}
+    assert cursor.execute.call_count == calls
+
+
+def test_iter_cases_by_year_uses_named_cursor(fake_db, tmp_path):
+    conn, cursor = fake_db
+    cursor.__enter__.return_value = cursor
+    cursor.__iter__.return_value = iter(
+        [
+            {"court_file_no": "IMM-1-25", "office": "A"},
+            {"court_file_no": "IMM-2-25", "office": "B"},
+        ]
+    )
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+
+    rows = svc.get_cases_by_year_from_database(2025)
+
+    assert rows == [
+        {"court_file_no": "IMM-1-25", "office": "A"},
+        {"court_file_no": "IMM-2-25", "office": "B"},
+    ]
+    assert conn.cursor.call_args.kwargs["name"] == "cases_by_year_2025"
+    assert conn.cursor.call_args.kwargs["cursor_factory"] is export_module.RealDictCursor
+    assert cursor.itersize == ExportService.STREAM_ITERSIZE
+
+
+def test_export_year_to_ndjson_streams_copy_output(fake_db, tmp_path):
+    conn, cursor = fake_db
+    cursor.mogrify.return_value = b"SELECT row_to_json(c) FROM cases c WHERE x = '-25'"
+    cursor.copy_expert.side_effect = lambda sql, f: f.write('{"court_file_no": "IMM-1-25"}\n')
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+
+    path = svc.export_year_to_ndjson(2025, "y.ndjson")
+
+    assert open(path, encoding="utf-8").read() == '{"court_file_no": "IMM-1-25"}\n'
+    assert cursor.mogrify.call_args.args[1] == ("-25",)
+    assert cursor.copy_expert.call_args.args[0].startswith("COPY (SELECT row_to_json(c)")
+
+
+def test_batch_async_commit_is_opt_in(fake_db, tmp_path, monkeypatch):
+    conn, cursor = fake_db
+    monkeypatch.setattr(
+        export_module, "execute_values", lambda *a, **kw: [("IMM-1-25", True)]
+    )
+
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    svc.save_cases_to_database([Case(case_id="IMM-1-25")])
+    cursor.execute.assert_not_called()
+
+    monkeypatch.setenv("DB_BATCH_ASYNC_COMMIT", "true")
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    svc.save_cases_to_database([Case(case_id="IMM-1-25")])
+    cursor.execute.assert_called_once_with("SET LOCAL synchronous_commit = off")
+
+
+@pytest.mark.parametrize(
+    "estimate,expected,queries", [((1234,), 1234, 1), ((0,), 7, 2), ((-1,), 7, 2)]
+)
+def test_case_count_estimate(fake_db, tmp_path, estimate, expected, queries):
+    conn, cursor = fake_db
+    cursor.fetchone.side_effect = [estimate, (7,)]
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+
+    assert svc.get_case_count_from_database(exact=False) == expected
+    assert "reltuples" in cursor.execute.call_args_list[0].args[0]
+    assert cursor.execute.call_count == queries
+
+
+def test_cases_exist_returns_none_on_db_error(fake_db, tmp_path):
+    conn, cursor = fake_db
+    cursor.execute.side_effect = RuntimeError("db down")
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+
+    assert svc.cases_exist(["IMM-1-25"]) is None
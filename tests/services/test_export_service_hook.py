@@ -18,3 +18,65 @@ def test_export_service_basic_write(tmp_path):
     assert p.exists()
     data = json.loads(p.read_text(encoding="utf-8"))
     assert data.get("case_id") == case.case_id
+
+
+def test_export_to_json_streams_one_case_per_line(tmp_path):
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    cases = [make_case(f"IMM-{n}-25") for n in range(1, 4)]
+    path = Path(svc.export_to_json(cases, "batch.json"))
+    text = path.read_text(encoding="utf-8")
+    assert [d["case_id"] for d in json.loads(text)] == ["IMM-1-25", "IMM-2-25", "IMM-3-25"]
+    assert len(text.strip().splitlines()) == len(cases) + 2
+
+
+def test_cleanup_old_exports_keeps_newest(tmp_path):
+    import os
+
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    for n in range(4):
+        p = tmp_path / f"cases_export_{n}.json"
+        p.write_text("[]", encoding="utf-8")
+        os.utime(p, (1000 + n, 1000 + n))
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+
+    assert svc.cleanup_old_exports(keep_recent=2) == 2
+    assert [Path(p).name for p in svc.get_export_history()] == [
+        "cases_export_2.json",
+        "cases_export_3.json",
+    ]
+
+
+def test_encode_json_matches_stdlib_fallback(monkeypatch):
+    import json
+    from datetime import datetime
+
+    import src.services.export_service as export_module
+
+    payload = {"title": "Café v. Minister", "when": datetime(2024, 1, 2, 3, 4, 5), "n": [1, None]}
+    fast = export_module._encode_json(payload)
+    fast_indented = export_module._encode_json(payload, indent=True)
+    monkeypatch.setattr(export_module, "orjson", None)
+    assert export_module._encode_json(payload) == fast
+    assert export_module._encode_json(payload, indent=True) == fast_indented
+    assert json.loads(fast)["when"] == "2024-01-02 03:04:05"
+
+
+def test_export_case_to_json_recreates_removed_year_dir(tmp_path, monkeypatch):
+    import shutil
+
+    import src.services.export_service as export_module
+
+    monkeypatch.setattr(export_module.time, "sleep", lambda s: None)
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    first = Path(svc.export_case_to_json(Case(case_id="IMM-1-25")))
+    shutil.rmtree(first.parent)
+
+    second = Path(svc.export_case_to_json(Case(case_id="IMM-2-25")))
+    assert second.exists()
+
+
+def test_encode_json_falls_back_on_inputs_orjson_rejects():
+    import src.services.export_service as export_module
+
+    payload = {1: "int key", "big": 2 ** 70}
+    assert json.loads(export_module._encode_json(payload)) == {"1": "int key", "big": 2 ** 70}
@@ -1,6 +1,9 @@
 from pathlib import Path
+import shutil
 import tarfile
 
+import pytest
+
 from src.cli.purge import purge_year
 
 
@@ -24,3 +27,21 @@ def test_purge_creates_backup(tmp_path: Path):
         names = tar.getnames()
         # The archive should contain a path like '2024/sample.json'
         assert any("sample.json" in n for n in names)
+
+
+def test_backup_streams_through_pigz_when_available(tmp_path: Path, monkeypatch):
+    import src.services.files_purge as files_purge
+
+    gzip = shutil.which("gzip")
+    if gzip is None:
+        pytest.skip("gzip not available to stand in for pigz")
+    monkeypatch.setattr(files_purge.shutil, "which", lambda name: gzip)
+
+    output_dir = tmp_path / "output"
+    (output_dir / "2024").mkdir(parents=True)
+    (output_dir / "2024" / "sample.json").write_text("{}")
+
+    archive = files_purge.backup_output_year(output_dir, 2024)
+
+    with tarfile.open(archive, "r:gz") as tar:
+        assert "2024/sample.json" in tar.getnames()
@@ -36,3 +36,54 @@ def test_purge_year_dry_run_creates_audit(tmp_path: Path):
     # references to the created files
     assert any("case1.json" in p for p in result["files"]["output_files"]) 
     assert any("modal_IMM-1-25" in p for p in result["files"]["modal_html"]) 
+
+
+def test_purge_year_dry_run_streams_db_scan(tmp_path: Path, monkeypatch):
+    import src.cli.purge as purge_mod
+
+    scans = []
+
+    class _Cursor:
+        description = [("court_file_no",), ("id",)]
+
+        def __init__(self, name=None):
+            self.name = name
+            self.itersize = None
+            self.sql = None
+            if name:
+                scans.append(self)
+
+        def execute(self, sql, params=None):
+            self.sql = sql
+
+        def __iter__(self):
+            return iter([(1, "IMM-1-23"), (2, "IMM-2-24"), (3, "IMM-3-23")])
+
+        def close(self):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    class _Conn:
+        def cursor(self, name=None):
+            return _Cursor(name)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(purge_mod.psycopg2, "connect", lambda **kw: _Conn())
+
+    result = purge_year(
+        2023,
+        dry_run=True,
+        output_dir=str(tmp_path / "output"),
+        logs_dir=str(tmp_path / "logs"),
+    )
+
+    assert result["db"]["candidate_case_ids"] == [1, 3]
+    assert scans and scans[0].itersize == purge_mod.DRY_RUN_ITERSIZE
+    assert "LIKE '%-2023' OR court_file_no LIKE '%-23'" in scans[0].sql
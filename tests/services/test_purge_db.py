@@ -66,3 +66,25 @@ def test_db_purge_year_commits_and_deletes(tmp_path: Path):
     assert any("2022" in r for r in remaining)
 
     conn.close()
+
+
+def test_db_purge_year_sql_path_filters_by_court_file_suffix(tmp_path: Path):
+    dbfile = tmp_path / "cf.db"
+    conn = sqlite3.connect(str(dbfile))
+    cur = conn.cursor()
+    cur.execute("CREATE TABLE cases (id INTEGER PRIMARY KEY, court_file_no TEXT)")
+    cur.execute("CREATE TABLE docket_entries (id INTEGER PRIMARY KEY, case_id INTEGER)")
+    cur.executemany(
+        "INSERT INTO cases (id, court_file_no) VALUES (?, ?)",
+        [(1, "IMM-1-24"), (2, "IMM-2-2024"), (3, "IMM-3-25"), (4, "IMM-1924")],
+    )
+    conn.commit()
+    conn.close()
+
+    res = db_purge_year(2024, lambda: sqlite3.connect(str(dbfile)), sql_year_filter=True)
+
+    assert sorted(res["candidate_case_ids"]) == [1, 2]
+    conn = sqlite3.connect(str(dbfile))
+    remaining = [r[0] for r in conn.execute("SELECT id FROM cases ORDER BY id")]
+    conn.close()
+    assert remaining == [3, 4]
@@ -23,3 +23,38 @@ def test_purge_removes_output_and_modal(tmp_path: Path):
     assert "files_removed" in res
     assert res["files_removed"]["output"]["removed_files"] >= 1
     assert res["files_removed"]["modal_html"]["removed"] == 1
+
+
+def test_purge_output_year_counts_nested_tree(tmp_path: Path):
+    from src.services.files_purge import purge_output_year
+
+    year_dir = tmp_path / "2024"
+    (year_dir / "a" / "b").mkdir(parents=True)
+    (year_dir / "top.json").write_text("{}")
+    (year_dir / "a" / "x.json").write_text("{}")
+    (year_dir / "a" / "b" / "y.json").write_text("{}")
+
+    res = purge_output_year(tmp_path, 2024)
+
+    assert res == {"removed_files": 3, "removed_dirs": 2}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_purge_output_year_unlinks_symlinked_dir_without_following(tmp_path: Path):
+    from src.services.files_purge import purge_output_year
+
+    output_dir = tmp_path / "output"
+    year_dir = output_dir / "2024"
+    (year_dir / "sub").mkdir(parents=True)
+    (year_dir / "sub" / "a.json").write_text("{}")
+    target = tmp_path / "elsewhere"
+    target.mkdir()
+    (target / "keep.json").write_text("{}")
+    (year_dir / "link").symlink_to(target, target_is_directory=True)
+
+    res = purge_output_year(output_dir, 2024)
+
+    # Same counts shutil.rmtree + os.walk reported: the link is a dir entry
+    assert res == {"removed_files": 1, "removed_dirs": 2}
+    assert list(output_dir.iterdir()) == []
+    assert (target / "keep.json").exists()
@@ -77,3 +77,24 @@ def test_db_purge_year_fallback_python_filter():
     # two cases in 2025
     assert res["cases_deleted"] == 2 or res["cases_deleted"] == -1
     assert res["docket_entries_deleted"] == 4
+
+
+def test_year_from_court_file_no():
+    from src.services.purge_service import year_from_court_file_no
+
+    assert year_from_court_file_no("IMM-123-25") == 2025
+    assert year_from_court_file_no("IMM-123-2024") == 2024
+    assert year_from_court_file_no("IMM-123") is None
+    assert year_from_court_file_no(None) is None
+
+
+def test_row_matches_year_precedence():
+    from src.services.purge_service import _row_matches_year
+
+    # filing date wins
+    assert _row_matches_year(2024, "2024-05-01", "IMM-1-25", None, has_filing=True, has_court=True)
+    # court-file year decides when filing date is for another year
+    assert not _row_matches_year(2024, "2023-05-01", "IMM-1-25", "2024-01-01", has_filing=True, has_court=True)
+    # scraped_at only without a filing column and without a court-file year
+    assert _row_matches_year(2024, None, "IMM-1", "2024-01-01", has_filing=False, has_court=True)
+    assert not _row_matches_year(2024, None, "IMM-1", "2024-01-01", has_filing=True, has_court=True)
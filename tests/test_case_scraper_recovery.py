@@ -35,3 +35,131 @@ def test_restart_exceeds_limit_raises(monkeypatch):
 
     with pytest.raises(RuntimeError):
         svc._get_driver()
+
+
+def test_scrape_single_case_reloads_page_on_every_call(monkeypatch):
+    import src.services.case_scraper_service as mod
+
+    svc = CaseScraperService(headless=True)
+    svc.rate_limiter = MagicMock()
+    driver = MagicMock()
+    driver.title = "IMM-1-25"
+    driver.execute_script.side_effect = [
+        "<html><body>first</body></html>",
+        "<html><body>docket updated</body></html>",
+    ]
+    monkeypatch.setattr(svc, "_get_driver", lambda: driver)
+    monkeypatch.setattr(mod, "WebDriverWait", MagicMock())
+
+    url = "https://www.fct-cf.ca/en/court-files-and-decisions/IMM-1-25"
+    first = svc.scrape_single_case(url)
+    second = svc.scrape_single_case(url)
+
+    # Repeat scrapes must see the live page, not a copy from an earlier call
+    assert driver.get.call_count == 2
+    assert first.html_content == "<html><body>first</body></html>"
+    assert second.html_content == "<html><body>docket updated</body></html>"
+    assert second.case_id == "IMM-1-25"
+    assert second.url == url
+
+
+def test_setup_driver_attaches_to_debugger_address(monkeypatch):
+    import src.services.case_scraper_service as mod
+
+    captured = {}
+
+    def fake_chrome(service=None, options=None):
+        captured["options"] = options
+        return MagicMock()
+
+    monkeypatch.setattr(mod, "ChromeDriverManager", MagicMock())
+    monkeypatch.setattr(mod, "Service", MagicMock())
+    monkeypatch.setattr(mod.webdriver, "Chrome", fake_chrome)
+
+    svc = CaseScraperService(headless=True, debugger_address="127.0.0.1:9222")
+    svc._setup_driver()
+
+    opts = captured["options"]
+    assert opts.experimental_options["debuggerAddress"] == "127.0.0.1:9222"
+    assert "--headless" not in opts.arguments
+
+
+def test_setup_driver_uses_remote_url(monkeypatch):
+    import src.services.case_scraper_service as mod
+
+    remote = MagicMock()
+    monkeypatch.setattr(mod.webdriver, "Remote", remote)
+    monkeypatch.setattr(mod, "ChromeDriverManager", MagicMock(side_effect=AssertionError))
+
+    svc = CaseScraperService(headless=True, remote_url="http://grid:4444/wd/hub")
+    driver = svc._setup_driver()
+
+    assert driver is remote.return_value
+    assert remote.call_args.kwargs["command_executor"] == "http://grid:4444/wd/hub"
+
+
+def test_page_html_prefers_outer_html():
+    svc = CaseScraperService(headless=True)
+    driver = MagicMock()
+    driver.execute_script.return_value = "<html><body>live</body></html>"
+    driver.page_source = "<html>serialized</html>"
+    assert svc._page_html(driver) == "<html><body>live</body></html>"
+
+    driver.execute_script.side_effect = Exception("no js")
+    assert svc._page_html(driver) == "<html>serialized</html>"
+
+
+def test_search_case_flags_429_page_without_search_input(monkeypatch):
+    import src.services.case_scraper_service as mod
+
+    svc = CaseScraperService(headless=True)
+    svc.rate_limiter = MagicMock()
+    svc._initialized = True
+    driver = MagicMock()
+    driver.title = "429 Too Many Requests"
+    driver.find_elements.return_value = []
+    monkeypatch.setattr(svc, "_get_driver", lambda: driver)
+    reinit = MagicMock()
+    monkeypatch.setattr(svc, "initialize_page", reinit)
+    # No search input on the throttling page
+    monkeypatch.setattr(
+        mod, "WebDriverWait", MagicMock(side_effect=AssertionError("should not look for input"))
+    )
+
+    assert svc.search_case("IMM-1-25") is False
+    assert svc.rate_limited is True
+    reinit.assert_not_called()
+
+
+def test_search_case_flags_429_when_initialize_page_fails(monkeypatch):
+    svc = CaseScraperService(headless=True)
+    svc._initialized = False
+    driver = MagicMock()
+    driver.title = "Too Many Requests"
+    svc._driver = driver
+
+    def failing_init():
+        raise RuntimeError("search form not found")
+
+    monkeypatch.setattr(svc, "initialize_page", failing_init)
+
+    assert svc.search_case("IMM-1-25") is False
+    assert svc.rate_limited is True
+
+
+@pytest.mark.parametrize(
+    "title,expected",
+    [
+        ("429 Too Many Requests", True),
+        ("Error 429", True),
+        ("Too Many Requests", True),
+        ("IMM-14290-25 - Federal Court", False),
+        ("Page 4290 of results", False),
+        ("", False),
+    ],
+)
+def test_is_rate_limited_matches_whole_status_only(title, expected):
+    svc = CaseScraperService(headless=True)
+    driver = MagicMock()
+    driver.title = title
+    assert svc._is_rate_limited(driver) is expected
@@ -5,3 +5,16 @@ def test_case_scraper_service_basic_methods_exist():
     assert callable(getattr(svc, "initialize_page", None))
     assert callable(getattr(svc, "_get_driver", None))
     assert callable(getattr(svc, "_restart_driver", None))
+
+
+def test_parse_docket_date_formats_and_cache():
+    from datetime import date
+
+    from src.services.case_scraper_service import _parse_docket_date
+
+    _parse_docket_date.cache_clear()
+    assert _parse_docket_date("2025-01-02") == date(2025, 1, 2)
+    assert _parse_docket_date("10-NOV-2025") == date(2025, 11, 10)
+    assert _parse_docket_date("") is None
+    _parse_docket_date("10-NOV-2025")
+    assert _parse_docket_date.cache_info().hits == 1
@@ -0,0 +1,31 @@
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "clean_export", Path(__file__).resolve().parents[1] / "scripts" / "clean_export.py"
+)
+clean_export = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(clean_export)
+
+
+def test_strict_match_beats_loose_header_match():
+    html = (
+        "<p>Office : loose value</p>"
+        "<table><tr><td>x</td></tr></table>"
+        "<strong>Office :</strong> Toronto"
+    )
+    assert clean_export.extract_label_value(html, "Office") == "Toronto"
+
+
+def test_first_strict_match_in_document_wins():
+    html = (
+        "<strong>Office :</strong> Vancouver"
+        "<table><tr><td>x</td></tr></table>"
+        "<strong>Office :</strong> Toronto"
+    )
+    assert clean_export.extract_label_value(html, "Office") == "Vancouver"
+
+
+def test_loose_match_used_when_no_strict_match():
+    html = "<p>Language : English</p><table></table>"
+    assert clean_export.extract_label_value(html, "Language") == "English"
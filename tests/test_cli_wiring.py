@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 
 def test_cli_wiring_init():
     from src.cli.main import FederalCourtScraperCLI
@@ -34,3 +36,129 @@ def test_cli_single_calls_exporter(monkeypatch):
     result = cli.scrape_single_case("IMM-1-25")
     assert result is not None
     mock_exporter.export_case_to_json.assert_called_once_with(fake_case)
+
+
+def test_cli_rate_limited_search_backs_off_without_counting_failure(monkeypatch):
+    from src.cli import main as cli_main
+    from src.cli.main import FederalCourtScraperCLI
+
+    cli = FederalCourtScraperCLI()
+    sleeps = []
+    monkeypatch.setattr(cli_main.time, "sleep", lambda s: sleeps.append(s))
+
+    mock_scraper = MagicMock()
+    mock_scraper._initialized = True
+    mock_scraper.rate_limited = True
+    mock_scraper.search_case.return_value = False
+    cli.scraper = mock_scraper
+
+    assert cli.scrape_single_case("IMM-1-25") is None
+    assert cli.consecutive_failures == 0
+    assert len(sleeps) == cli_main.Config.get_rate_limit_max_retries()
+    assert all(s <= cli_main.Config.get_rate_limit_backoff_cap_seconds() for s in sleeps)
+
+
+def test_cli_rate_limited_initialize_page_does_not_count_failure(monkeypatch):
+    from src.cli import main as cli_main
+    from src.cli.main import FederalCourtScraperCLI
+
+    cli = FederalCourtScraperCLI()
+    monkeypatch.setattr(cli_main.time, "sleep", lambda s: None)
+
+    mock_scraper = MagicMock()
+    mock_scraper._initialized = False
+    mock_scraper.initialize_page.side_effect = RuntimeError("search form not found")
+    mock_scraper._check_rate_limited.return_value = True
+    mock_scraper.rate_limited = True
+    mock_scraper.search_case.return_value = False
+    cli.scraper = mock_scraper
+
+    assert cli.scrape_single_case("IMM-1-25") is None
+    assert cli.consecutive_failures == 0
+    mock_scraper._check_rate_limited.assert_called_once_with(mock_scraper._driver, "IMM-1-25")
+
+    # A non-throttling initialization error is still a failure
+    mock_scraper._check_rate_limited.return_value = False
+    assert cli.scrape_single_case("IMM-2-25") is None
+    assert cli.consecutive_failures == 1
+
+
+def test_cli_success_resets_consecutive_failures():
+    from src.cli.main import FederalCourtScraperCLI
+
+    cli = FederalCourtScraperCLI()
+    cli.max_consecutive_failures = 2
+    cli.exporter = MagicMock()
+    cli.exporter.save_case_to_database.return_value = ("ok", "saved")
+
+    mock_scraper = MagicMock()
+    mock_scraper._initialized = True
+    mock_scraper.rate_limited = False
+    # ok, ok, fail, ok, ok, ok
+    mock_scraper.search_case.side_effect = [True, True, False, True, True, True]
+    fake_case = MagicMock()
+    fake_case.case_id = "IMM-1-25"
+    mock_scraper.scrape_case_data.return_value = fake_case
+    cli.scraper = mock_scraper
+
+    results = [cli.scrape_single_case(f"IMM-{n}-25") for n in range(1, 7)]
+    assert [r is not None for r in results] == [True, True, False, True, True, True]
+    assert cli.consecutive_failures == 0
+    assert not cli.emergency_stop
+
+
+def test_cli_batch_checks_existing_cases_in_one_query(monkeypatch):
+    from src.cli.main import FederalCourtScraperCLI
+
+    cli = FederalCourtScraperCLI()
+    cli.force = False
+    cli.exporter = MagicMock()
+    cli.exporter.cases_exist.return_value = {"IMM-1-25", "IMM-2-25"}
+    monkeypatch.setattr(
+        cli.discovery,
+        "generate_case_numbers_from_last",
+        lambda year, max_cases: ["IMM-1-25", "IMM-2-25"],
+    )
+    monkeypatch.setattr("src.cli.main.RunLogger", MagicMock())
+
+    cases, skipped = cli.scrape_batch_cases(2025, max_cases=2)
+
+    assert cases == []
+    assert [s["case_number"] for s in skipped] == ["IMM-1-25", "IMM-2-25"]
+    cli.exporter.cases_exist.assert_called_once_with(["IMM-1-25", "IMM-2-25"])
+    cli.exporter.case_exists.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "bulk", [{"return_value": None}, {"side_effect": RuntimeError("db down")}]
+)
+def test_cli_batch_falls_back_to_per_case_check_when_bulk_lookup_fails(monkeypatch, bulk):
+    from src.cli.main import FederalCourtScraperCLI
+
+    cli = FederalCourtScraperCLI()
+    cli.force = False
+    cli.exporter = MagicMock()
+    cli.exporter.cases_exist.configure_mock(**bulk)
+    cli.exporter.case_exists.return_value = True
+    monkeypatch.setattr(
+        cli.discovery,
+        "generate_case_numbers_from_last",
+        lambda year, max_cases: ["IMM-1-25", "IMM-2-25"],
+    )
+    monkeypatch.setattr("src.cli.main.RunLogger", MagicMock())
+
+    cases, skipped = cli.scrape_batch_cases(2025, max_cases=2)
+
+    assert [s["case_number"] for s in skipped] == ["IMM-1-25", "IMM-2-25"]
+    assert cli.exporter.case_exists.call_count == 2
+
+
+def test_make_run_id_is_stable_for_parameters():
+    from src.cli.main import _make_run_id
+
+    a = _make_run_id({"year": 2025, "max_cases": 10})
+    b = _make_run_id({"max_cases": 10, "year": 2025})
+    c = _make_run_id({"year": 2024, "max_cases": 10})
+    assert a.split("_")[-1] == b.split("_")[-1]
+    assert a.split("_")[-1] != c.split("_")[-1]
+    assert len(a.split("_")[-1]) == 8
@@ -147,3 +147,18 @@ def test_export_case_to_json_retries_on_mkstemp(tmp_path, monkeypatch):
         Path(path).unlink()
     except Exception:
         pass
+
+
+def test_export_case_to_json_fsync_is_opt_in(monkeypatch, tmp_path):
+    synced = []
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+    monkeypatch.delenv("FCT_EXPORT_FSYNC", raising=False)
+
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    svc.export_case_to_json(make_case("IMM-7-25"))
+    assert synced == []
+
+    monkeypatch.setenv("FCT_EXPORT_FSYNC", "true")
+    svc = ExportService(config=None, output_dir=str(tmp_path))
+    svc.export_case_to_json(make_case("IMM-8-25"))
+    assert len(synced) == 1
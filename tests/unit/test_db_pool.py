@@ -0,0 +1,44 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.lib import db_pool
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    created = []
+
+    def factory(minconn, maxconn, **kwargs):
+        pool = MagicMock()
+        pool.closed = False
+        pool.getconn.return_value = MagicMock(closed=False)
+        created.append((pool, kwargs))
+        return pool
+
+    monkeypatch.setattr(db_pool, "ThreadedConnectionPool", factory)
+    monkeypatch.setattr(db_pool, "_pools", {})
+    return created
+
+
+def test_pool_reused_per_config(fake_pool):
+    cfg = {"host": "h", "database": "d"}
+    assert db_pool.get_pool(cfg) is db_pool.get_pool(dict(cfg))
+    assert db_pool.get_pool({"host": "other"}) is not db_pool.get_pool(cfg)
+    assert len(fake_pool) == 2
+
+
+def test_connection_returned_to_pool_after_rollback(fake_pool):
+    with db_pool.get_connection({"host": "h"}) as conn:
+        pass
+    pool = fake_pool[0][0]
+    conn.rollback.assert_called_once()
+    pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_broken_connection_discarded(fake_pool):
+    with pytest.raises(RuntimeError):
+        with db_pool.get_connection({"host": "h"}) as conn:
+            conn.rollback.side_effect = Exception("connection lost")
+            raise RuntimeError("query failed")
+    fake_pool[0][0].putconn.assert_called_once_with(conn, close=True)
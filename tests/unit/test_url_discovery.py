@@ -24,3 +24,53 @@ def test_generate_case_numbers_from_last_resumes_correctly(monkeypatch):
     assert cases[0] == "IMM-5-25"
     assert cases[:3] == ["IMM-5-25", "IMM-6-25", "IMM-7-25"]
     cases = svc.generate_case_numbers_from_last(2025, max_cases=3)
+
+
+def test_get_last_processed_case_filters_on_year_suffix(monkeypatch):
+    from contextlib import contextmanager
+    from unittest.mock import MagicMock
+
+    import src.services.url_discovery_service as mod
+
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"court_file_no": "IMM-1000-25"}
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def fake_get_connection(cfg):
+        yield conn
+
+    monkeypatch.setattr(mod, "get_connection", fake_get_connection)
+
+    svc = UrlDiscoveryService(Config)
+    assert svc.get_last_processed_case(2025) == "IMM-1000-25"
+    sql, params = cursor.execute.call_args.args
+    assert "right(court_file_no, 3)" in sql
+    # Must match the bigint expression of cases_year_seq_bigint_idx
+    assert "::bigint DESC NULLS LAST" in sql
+    assert params == ("-25",)
+
+
+def test_get_processing_stats_filters_on_year_suffix(monkeypatch):
+    from contextlib import contextmanager
+    from unittest.mock import MagicMock
+
+    import src.services.url_discovery_service as mod
+
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"total_cases": 3, "last_scraped": None}
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def fake_get_connection(cfg):
+        yield conn
+
+    monkeypatch.setattr(mod, "get_connection", fake_get_connection)
+
+    stats = UrlDiscoveryService(Config).get_processing_stats(2024)
+    assert stats == {"year": 2024, "total_cases": 3, "last_scraped": None}
+    sql, params = cursor.execute.call_args.args
+    assert "right(court_file_no, 3) = %s" in sql
+    assert params == ("-24",)